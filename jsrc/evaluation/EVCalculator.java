@@ -106,6 +106,51 @@ public class EVCalculator {
     return calculateSplitEV(valueCounts, playerHand, dealerHand, true);
   }
 
+  /**
+   * Calculates the stand, hit, double, and split expected values of several
+   * player hands against the same dealer hand in a single call. All hands share
+   * this calculator's cache, so dealer outcomes computed for one hand are reused
+   * by the others.
+   *
+   * @param valueCounts An array representing the current distribution of card
+   *                    values in the deck.
+   * @param playerHands A list of player hands, each a list of integers.
+   * @param dealerHand  A list of integers representing the dealer's current hand.
+   * @return One row per player hand, holding the stand, hit, double, and split
+   *         expected values in that order.
+   * @throws IllegalArgumentException if any of the arguments are {@code null}.
+   */
+  public double[][] calculateAllEVs(int[] valueCounts, List<List<Integer>> playerHands, List<Integer> dealerHand) {
+    if (valueCounts == null || playerHands == null || dealerHand == null) {
+      throw new IllegalArgumentException(
+          "Arguments to calculateAllEVs cannot be null: valueCounts, playerHands, and dealerHand are required");
+    }
+
+    double[][] results = new double[playerHands.size()][];
+
+    for (int i = 0; i < playerHands.size(); i++) {
+      List<Integer> playerHand = playerHands.get(i);
+
+      results[i] = new double[] {
+          calculateStandEV(valueCounts, playerHand, dealerHand),
+          calculateHitEV(valueCounts, playerHand, dealerHand),
+          calculateDoubleEV(valueCounts, playerHand, dealerHand),
+          calculateSplitEV(valueCounts, playerHand, dealerHand)
+      };
+    }
+
+    return results;
+  }
+
+  /**
+   * Clears every memoized expected value. Cached states are keyed by the full
+   * deck composition, so once a card leaves the deck they are almost never hit
+   * again and only keep the heap growing.
+   */
+  public void clearCache() {
+    cache.clear();
+  }
+
   // ------------------------------------------------------------------------
   // Private Recursive Calculation Methods
   // ------------------------------------------------------------------------
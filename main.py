@@ -1,3 +1,6 @@
+from typing import Dict, Tuple
+
+import importlib
 import os
 import threading
 import logging
@@ -7,9 +10,10 @@ from psrc.evaluation.card_deck import CardDeck
 from psrc.detection.card_detector import CardDetector
 from psrc.detection.card_tracker import CardTracker
 from psrc.config.config_manager import ConfigManager
-from psrc.annotation.mpl_annotator import MPLAnnotator
+from psrc.core.interfaces.i_ev_calculator import IExpectedValueCalculator
+from psrc.core.interfaces.i_frame_annotator import IFrameAnnotator
 from psrc.input.ocv_video_stream import OCVVideoStream
-from psrc.evaluation.ev_calculator_wrapper import EVCalculatorWrapper
+from psrc.evaluation.async_hand_evaluator import AsyncHandEvaluator
 from psrc.evaluation.hand_evaluator import HandEvaluator
 from psrc.detection.hand_tracker import HandTracker
 from psrc.display.hybrid_display import HybridDisplay
@@ -18,6 +22,79 @@ os.environ["YOLO_VERBOSE"] = "0"
 logging.getLogger("psrc.core.analysis_engine").setLevel(logging.WARNING)
 logging.getLogger("ultralytics").setLevel(logging.WARNING)
 
+# Annotator implementations selectable via annotator_backend, imported lazily so unused backends cost nothing
+ANNOTATOR_BACKENDS: Dict[str, Tuple[str, str]] = {
+    "ocv": ("psrc.annotation.ocv_annotator", "OCVAnnotator"),
+    "mpl": ("psrc.annotation.mpl_annotator", "MPLAnnotator"),
+}
+
+
+# CPU cores kept free of detector threads for the capture and display stages
+RESERVED_CORES = 2
+
+
+def create_annotator(backend: str) -> IFrameAnnotator:
+    """
+    Create the frame annotator registered under the given backend name.
+
+    Parameters:
+        backend (str): The key of the annotator in ANNOTATOR_BACKENDS.
+
+    Returns:
+        IFrameAnnotator: A new annotator instance.
+
+    Raises:
+        ValueError: If the backend name is not registered.
+    """
+    if backend not in ANNOTATOR_BACKENDS:
+        raise ValueError(
+            f"Unknown annotator backend: {backend} (expected one of {', '.join(ANNOTATOR_BACKENDS)})"
+        )
+
+    module_name, class_name = ANNOTATOR_BACKENDS[backend]
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+def create_ev_calculator(settings: ConfigManager) -> IExpectedValueCalculator:
+    """
+    Create the expected value calculator selected by the ev_backend setting.
+
+    The Java wrapper is imported only when selected, so the Numba backend never loads JPype or starts a JVM.
+
+    Parameters:
+        settings (ConfigManager): The loaded application settings.
+
+    Returns:
+        IExpectedValueCalculator: A new calculator instance.
+
+    Raises:
+        ValueError: If the backend name is not recognized.
+    """
+    if settings.ev_backend == "java":
+        from psrc.evaluation.ev_calculator_wrapper import EVCalculatorWrapper
+
+        return EVCalculatorWrapper(
+            jar_path=settings.ev_jar_path,
+            class_path=settings.ev_class_path,
+        )
+
+    if settings.ev_backend == "numba":
+        from psrc.evaluation.numba_ev_calculator import NumbaEVCalculator
+
+        return NumbaEVCalculator(
+            blackjack_odds=settings.blackjack_odds,
+            dealer_hits_on_soft_17=settings.dealer_hits_on_soft_17,
+            dealer_peaks_for_21=settings.dealer_peaks_for_21,
+            natural_blackjack_splits=settings.natural_blackjack_splits,
+            double_after_split=settings.double_after_split,
+            hit_split_aces=settings.hit_split_aces,
+            double_split_aces=settings.double_split_aces,
+        )
+
+    raise ValueError(
+        f"Unknown EV backend: {settings.ev_backend} (expected one of java, numba)"
+    )
+
 
 def main() -> None:
     """
@@ -26,15 +103,28 @@ def main() -> None:
     This function is used to load configuration settings to be passed in to the analysis engine. It initializes
     all required componenets and passes them to the analysis engine.
     """
-    settings = ConfigManager()
+    settings = ConfigManager.from_yaml("config.yaml")
 
     # Core Components
     video_reader = OCVVideoStream(
         video_source=settings.video_source,
-        inference_frame_size=tuple(settings.inference_frame_size),
+        inference_frame_size=settings.inference_frame_size,
+    )
+
+    # A detector_threads of 0 leaves RESERVED_CORES free and gives the detector the rest
+    detector_threads = settings.detector_threads or max(
+        1, (os.cpu_count() or 1) - RESERVED_CORES
     )
 
-    card_detector = CardDetector(model_path=settings.yolo_path)
+    card_detector = CardDetector(
+        model_path=settings.yolo_path,
+        backend=settings.detector_backend,
+        precision=settings.detector_precision,
+        calibration_data=settings.detector_calibration_data or None,
+        batch_size=settings.inference_batch_size,
+        nms_threshold=settings.nms_threshold,
+        num_threads=detector_threads,
+    )
 
     deck = CardDeck(settings.deck_count)
 
@@ -48,14 +138,14 @@ def main() -> None:
 
     hand_tracker = HandTracker()
 
-    ev_calculator = EVCalculatorWrapper(
-        jar_path=settings.ev_jar_path,
-        class_path=settings.ev_class_path,
-    )
+    ev_calculator = create_ev_calculator(settings)
 
     hand_evaluator = HandEvaluator(deck=deck, ev_calculator=ev_calculator)
 
-    annotator = MPLAnnotator()
+    if settings.async_evaluation:
+        hand_evaluator = AsyncHandEvaluator(hand_evaluator)
+
+    annotator = create_annotator(settings.annotator_backend)
 
     display = HybridDisplay(
         window_name=settings.window_name, window_frame_size=settings.window_frame_size
@@ -72,8 +162,12 @@ def main() -> None:
         annotator=annotator,
         display=display,
         inference_interval=settings.inference_interval,
-        inference_frame_size=tuple(settings.inference_frame_size),
-        annotation_frame_size=tuple(settings.annotation_frame_size),
+        inference_batch_size=settings.inference_batch_size,
+        scene_change_bits=settings.scene_change_bits,
+        scene_max_skips=settings.scene_max_skips,
+        inference_frame_size=settings.inference_frame_size,
+        annotation_frame_size=settings.annotation_frame_size,
+        use_opencl=settings.use_opencl,
     )
 
     # Engine Thread
@@ -88,6 +182,7 @@ def main() -> None:
         engine_thread.join()
         video_reader.release()
         display.release()
+        hand_evaluator.release()
         ev_calculator.release()
 
 
@@ -1,22 +1,19 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
-import cv2
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
+from matplotlib.artist import Artist
+from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 from psrc.core.interfaces.i_frame_annotator import IFrameAnnotator
 
-matplotlib.use("Agg")
-
 
 class MPLAnnotator(IFrameAnnotator):
     """
     MPLAnnotator is an implementation of the IFrameAnnotator interface.
 
-    This implementation uses Matplotlib’s Agg backend to draw detection and track overlays on frames. Bounding
+    This implementation uses Matplotlib’s Agg canvas to draw detection and track overlays on frames. Bounding
     boxes are colored by track state, and labels are rendered with proportional thickness and font size.
 
     Attributes:
@@ -24,6 +21,8 @@ class MPLAnnotator(IFrameAnnotator):
         _FONT_SIZE_RATIO (float): The relative font size versus frame height.
         _CONFIRMED_COLOR (Tuple[float, float, float]): The RGB color for confirmed tracks.
         _TENTATIVE_COLOR (Tuple[float, float, float]): The RGB color for tentative tracks.
+        _CONFIRMED_TEXT_COLOR (Tuple[float, float, float]): The RGB label color for confirmed tracks.
+        _TENTATIVE_TEXT_COLOR (Tuple[float, float, float]): The RGB label color for tentative tracks.
     """
 
     _BOX_THICKNESS_RATIO = 0.003
@@ -31,6 +30,44 @@ class MPLAnnotator(IFrameAnnotator):
 
     _CONFIRMED_COLOR = (0, 1, 0)
     _TENTATIVE_COLOR = (1, 0, 0)
+    _CONFIRMED_TEXT_COLOR = tuple(c * 0.75 for c in _CONFIRMED_COLOR)
+    _TENTATIVE_TEXT_COLOR = tuple(c * 0.75 for c in _TENTATIVE_COLOR)
+
+    def __init__(self) -> None:
+        """
+        Initialize MPLAnnotator with an empty render cache.
+
+        The figure, canvas, axes, and image artist are built lazily on the first frame and reused for every
+        subsequent frame of the same size.
+        """
+        self._fig = None
+        self._canvas = None
+        self._ax = None
+        self._im = None
+        self._size: Optional[Tuple[int, int]] = None
+        self._artists: List[Artist] = []
+
+    def _prepare_canvas(self, h: int, w: int) -> None:
+        """
+        Build the cached figure, canvas, axes, and image artist for frames of the given size.
+
+        The figure is created through the object-oriented API and attached to an Agg canvas directly, so it is
+        never registered with pyplot and needs no explicit close; a previous figure is simply dropped.
+
+        Parameters:
+            h (int): The frame height in pixels.
+            w (int): The frame width in pixels.
+        """
+        fig = Figure(frameon=False, dpi=100)
+        fig.set_size_inches(w / fig.dpi, h / fig.dpi)
+        self._canvas = FigureCanvasAgg(fig)
+        self._ax = fig.add_axes([0, 0, 1, 1])
+        self._im = self._ax.imshow(np.zeros((h, w, 3), dtype=np.uint8))
+        self._ax.axis("off")
+
+        self._fig = fig
+        self._size = (h, w)
+        self._artists = []
 
     def annotate(
         self,
@@ -41,9 +78,10 @@ class MPLAnnotator(IFrameAnnotator):
         """
         Annotate a frame with detection and tracking information.
 
-        This implementation converts the OpenCV BGR frame to an RGB Matplotlib figure, for each confirmed
-        track draws a colored Rectangle patch and italic bold text showing track ID and label, and converts
-        back to BGR for OpenCV compatibility.
+        This implementation loads a channel-reversed (RGB) view of the OpenCV BGR frame into a cached Matplotlib
+        figure, removes the overlays drawn on the previous frame, for each confirmed track draws a colored
+        Rectangle patch and italic bold text showing track ID and label, and copies the rendered buffer back
+        out in BGR order for OpenCV compatibility.
 
         Parameters:
             frame (Any): The frame to annotate.
@@ -59,16 +97,25 @@ class MPLAnnotator(IFrameAnnotator):
         box_thickness = max(1, self._BOX_THICKNESS_RATIO * h)
         font_size = max(1, self._FONT_SIZE_RATIO * h)
 
-        fig = plt.figure(frameon=False, dpi=100)
-        fig.set_size_inches(w / fig.dpi, h / fig.dpi)
-        canvas = FigureCanvasAgg(fig)
-        ax = fig.add_axes([0, 0, 1, 1])
-        ax.imshow(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-        ax.axis("off")
+        if self._size != (h, w):
+            self._prepare_canvas(h, w)
+
+        ax = self._ax
+        confirmed_colors = (self._CONFIRMED_COLOR, self._CONFIRMED_TEXT_COLOR)
+        tentative_colors = (self._TENTATIVE_COLOR, self._TENTATIVE_TEXT_COLOR)
+
+        # Reversing the channel axis gives an RGB view of the BGR frame without copying it
+        self._im.set_data(frame[..., ::-1])
+
+        # Clear only the overlays added on the previous frame
+        for artist in self._artists:
+            artist.remove()
+        self._artists.clear()
 
         for track_id, track_meta in tracks.items():
-            bbox = track_meta["bbox"]
+            bbox = tuple(track_meta["bbox"])
 
+            # Detections are keyed by their box tuple, so membership is a single hash lookup
             if bbox not in detections:
                 continue
 
@@ -77,8 +124,11 @@ class MPLAnnotator(IFrameAnnotator):
 
             x1, y1, x2, y2 = map(int, bbox)
             text = f"ID: {track_id}, VAL: {label}"
-            box_color = self._CONFIRMED_COLOR if state == 1 else self._TENTATIVE_COLOR
-            text_color = tuple(c * 0.75 for c in box_color)
+
+            if state == 1:
+                box_color, text_color = confirmed_colors
+            else:
+                box_color, text_color = tentative_colors
 
             rect = Rectangle(
                 (x1, y1),
@@ -88,9 +138,9 @@ class MPLAnnotator(IFrameAnnotator):
                 edgecolor=box_color,
                 facecolor="none",
             )
-            ax.add_patch(rect)
+            self._artists.append(ax.add_patch(rect))
 
-            ax.text(
+            text_artist = ax.text(
                 x1,
                 y1 - box_thickness * 2,
                 text,
@@ -99,11 +149,11 @@ class MPLAnnotator(IFrameAnnotator):
                 fontstyle="italic",
                 weight="bold",
             )
+            self._artists.append(text_artist)
 
-        canvas.draw()
-        buf = np.frombuffer(canvas.buffer_rgba(), dtype=np.uint8)
+        self._canvas.draw()
+        buf = np.frombuffer(self._canvas.buffer_rgba(), dtype=np.uint8)
         rgba = buf.reshape((int(h), int(w), 4))
-        rgb = rgba[..., :3]
-        plt.close(fig)
 
-        return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+        # Select the BGR channels of the rendered RGBA buffer in reverse and materialize them in a single copy
+        return np.ascontiguousarray(rgba[..., 2::-1])
@@ -0,0 +1,174 @@
+from typing import Any, Dict, List, Tuple
+
+import cv2
+import numpy as np
+
+from psrc.core.interfaces.i_frame_annotator import IFrameAnnotator
+
+
+class OCVAnnotator(IFrameAnnotator):
+    """
+    OCVAnnotator is an implementation of the IFrameAnnotator interface.
+
+    This implementation uses OpenCV drawing primitives to draw detection and track overlays directly onto the
+    BGR frame, avoiding any color conversion or software rasterization through Matplotlib. Bounding boxes are
+    colored by track state, and labels are rendered with proportional thickness and font size.
+
+    Attributes:
+        _BOX_THICKNESS_RATIO (float): The relative thickness of box edges versus frame height.
+        _FONT_SIZE_RATIO (float): The relative font size (in points at 100 DPI) versus frame height.
+        _FONT_FACE (int): The OpenCV font face used for labels.
+        _CONFIRMED_COLOR (Tuple[int, int, int]): The BGR color for confirmed tracks.
+        _TENTATIVE_COLOR (Tuple[int, int, int]): The BGR color for tentative tracks.
+        _CONFIRMED_TEXT_COLOR (Tuple[int, int, int]): The BGR label color for confirmed tracks.
+        _TENTATIVE_TEXT_COLOR (Tuple[int, int, int]): The BGR label color for tentative tracks.
+        _BOX_COLORS (Tuple[Tuple[int, int, int], ...]): The box colors indexed by confirmed flag.
+        _TEXT_COLORS (Tuple[Tuple[int, int, int], ...]): The label colors indexed by confirmed flag.
+        _CORNER_INDEX (np.ndarray): The box columns gathered into the four corners of each box.
+    """
+
+    _BOX_THICKNESS_RATIO = 0.003
+    _FONT_SIZE_RATIO = 0.01
+    _FONT_FACE = cv2.FONT_HERSHEY_DUPLEX | cv2.FONT_ITALIC
+
+    _CONFIRMED_COLOR = (0, 255, 0)
+    _TENTATIVE_COLOR = (0, 0, 255)
+    _CONFIRMED_TEXT_COLOR = tuple(int(c * 0.75) for c in _CONFIRMED_COLOR)
+    _TENTATIVE_TEXT_COLOR = tuple(int(c * 0.75) for c in _TENTATIVE_COLOR)
+
+    # Color tables indexed by a 0/1 "is confirmed" flag
+    _BOX_COLORS = (_TENTATIVE_COLOR, _CONFIRMED_COLOR)
+    _TEXT_COLORS = (_TENTATIVE_TEXT_COLOR, _CONFIRMED_TEXT_COLOR)
+
+    # Box columns of the (x1, y1), (x2, y1), (x2, y2), (x1, y2) corners, in drawing order
+    _CORNER_INDEX = np.array([0, 1, 2, 1, 2, 3, 0, 3])
+
+    def __init__(self) -> None:
+        """
+        Initialize OCVAnnotator with an empty drawing-metrics cache.
+        """
+        self._metrics: Dict[int, Tuple[int, float, int]] = {}
+
+    def _get_metrics(self, h: int) -> Tuple[int, float, int]:
+        """
+        Get the box thickness, font scale, and text thickness for frames of the given height.
+
+        Metrics are computed once per frame height and cached, since the font scale lookup is the same for
+        every frame of a stream.
+
+        Parameters:
+            h (int): The frame height in pixels.
+
+        Returns:
+            Tuple[int, float, int]: The box thickness, font scale, and text thickness.
+        """
+        metrics = self._metrics.get(h)
+
+        if metrics is None:
+            box_thickness = max(1, int(round(self._BOX_THICKNESS_RATIO * h)))
+            font_size = max(1, self._FONT_SIZE_RATIO * h)
+            text_thickness = max(1, box_thickness // 2)
+
+            # Convert the point size used by the Matplotlib annotator (100 DPI) to a pixel height
+            font_scale = cv2.getFontScaleFromHeight(
+                self._FONT_FACE,
+                max(1, int(round(font_size * 100 / 72))),
+                text_thickness,
+            )
+
+            metrics = (box_thickness, font_scale, text_thickness)
+            self._metrics[h] = metrics
+
+        return metrics
+
+    def _collect_tracks(
+        self,
+        detections: Dict[tuple, Dict[str, Any]],
+        tracks: Dict[int, Dict[str, Any]],
+    ) -> Tuple[List[int], np.ndarray, np.ndarray, List[Any]]:
+        """
+        Gather the tracks matched to a detection into parallel arrays.
+
+        Parameters:
+            detections (Dict[Tuple, Dict[str, Any]]): A mapping of bounding box coordinates to their detection
+            information.
+            tracks (Dict[int, Dict[str, Any]]): A mapping of track IDs to their tracking information.
+
+        Returns:
+            Tuple[List[int], np.ndarray, np.ndarray, List[Any]]: The track IDs, an (N, 4) int32 array of
+            bounding boxes, an (N,) int8 array of confirmed flags, and the labels.
+        """
+        matched = [
+            (track_id, track_meta)
+            for track_id, track_meta in tracks.items()
+            if tuple(track_meta["bbox"]) in detections
+        ]
+
+        ids = [track_id for track_id, _ in matched]
+        bboxes = np.array(
+            [track_meta["bbox"] for _, track_meta in matched], dtype=np.float64
+        ).reshape(-1, 4)
+        confirmed = np.fromiter(
+            (track_meta.get("state", 0) == 1 for _, track_meta in matched),
+            dtype=np.int8,
+            count=len(matched),
+        )
+        labels = [track_meta.get("label", "N/A") for _, track_meta in matched]
+
+        return ids, bboxes.astype(np.int32), confirmed, labels
+
+    def annotate(
+        self,
+        frame: np.ndarray,
+        detections: Dict[tuple, Dict[str, Any]],
+        tracks: Dict[int, Dict[str, Any]],
+    ) -> np.ndarray:
+        """
+        Annotate a frame with detection and tracking information.
+
+        This implementation gathers the tracks matched to a detection into parallel arrays (IDs, int32 boxes,
+        confirmed flags, labels), then draws in place on the OpenCV BGR frame all boxes of each color with a
+        single polylines call, followed by bold italic text showing track ID and label for each track, with
+        colors looked up by confirmed flag.
+
+        Parameters:
+            frame (Any): The frame to annotate.
+            detections (Dict[Tuple, Dict[str, Any]]): A mapping of bounding box coordinates to their detection
+            information.
+            tracks (Dict[int, Dict[str, Any]]): A mapping of track IDs to their tracking information.
+
+        Returns:
+            Any: The annotated frame.
+        """
+        box_thickness, font_scale, text_thickness = self._get_metrics(frame.shape[0])
+        font_face = self._FONT_FACE
+        box_colors = self._BOX_COLORS
+        text_colors = self._TEXT_COLORS
+
+        ids, bboxes, confirmed, labels = self._collect_tracks(detections, tracks)
+
+        # Expand each box into its four corners with one gather so every box of a color is drawn in one
+        # polylines call
+        corners = bboxes[:, self._CORNER_INDEX].reshape(-1, 4, 1, 2)
+
+        for state, color in enumerate(box_colors):
+            polys = list(corners[confirmed == state])
+
+            if polys:
+                cv2.polylines(frame, polys, True, color, box_thickness)
+
+        for track_id, (x1, y1, _, _), state, label in zip(
+            ids, bboxes.tolist(), confirmed.tolist(), labels
+        ):
+            cv2.putText(
+                frame,
+                f"ID: {track_id}, VAL: {label}",
+                (x1, y1 - box_thickness * 2),
+                font_face,
+                font_scale,
+                text_colors[state],
+                text_thickness,
+                cv2.LINE_AA,
+            )
+
+        return frame
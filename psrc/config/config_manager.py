@@ -1,24 +1,85 @@
-from typing import Tuple, Union
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union
 
+import json
 import os
 import yaml
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+# Settings stored as YAML lists but exposed as tuples
+_TUPLE_FIELDS = frozenset(
+    {"inference_frame_size", "annotation_frame_size", "window_frame_size"}
+)
+
+
+@dataclass(frozen=True)
 class ConfigManager:
     """
     ConfigManager is responsible for loading and exposing application settings from a YAML file.
+
+    Settings are immutable once loaded. Instances are frozen and slotted, so they carry no per-instance
+    __dict__ and can be shared freely between threads, and they pickle by value for use across processes.
     """
 
+    __slots__ = (
+        "yolo_path",
+        "detector_backend",
+        "detector_precision",
+        "detector_calibration_data",
+        "detector_threads",
+        "ev_backend",
+        "async_evaluation",
+        "ev_jar_path",
+        "ev_class_path",
+        "video_source",
+        "inference_interval",
+        "inference_batch_size",
+        "scene_change_bits",
+        "scene_max_skips",
+        "overlap_threshold",
+        "iou_threshold",
+        "nms_threshold",
+        "confidence_threshold",
+        "confirmation_frames",
+        "removal_frames",
+        "inference_frame_size",
+        "annotation_frame_size",
+        "window_frame_size",
+        "use_opencl",
+        "window_name",
+        "annotator_backend",
+        "deck_count",
+        "blackjack_odds",
+        "dealer_hits_on_soft_17",
+        "dealer_peaks_for_21",
+        "natural_blackjack_splits",
+        "double_after_split",
+        "hit_split_aces",
+        "double_split_aces",
+    )
+
     yolo_path: str
+    detector_backend: str
+    detector_precision: str
+    detector_calibration_data: str
+    detector_threads: int
+    ev_backend: str
+    async_evaluation: bool
     ev_jar_path: str
     ev_class_path: str
 
     video_source: Union[int, str]
 
     inference_interval: float
+    inference_batch_size: int
+    scene_change_bits: int
+    scene_max_skips: int
 
     overlap_threshold: float
     iou_threshold: float
+    nms_threshold: float
     confidence_threshold: float
 
     confirmation_frames: int
@@ -27,49 +88,125 @@ class ConfigManager:
     inference_frame_size: Tuple[int, int]
     annotation_frame_size: Tuple[int, int]
     window_frame_size: Tuple[int, int]
+    use_opencl: bool
     window_name: str
+    annotator_backend: str
 
     deck_count: int
+    blackjack_odds: float
+    dealer_hits_on_soft_17: bool
+    dealer_peaks_for_21: bool
+    natural_blackjack_splits: bool
+    double_after_split: bool
+    hit_split_aces: bool
+    double_split_aces: bool
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """
+        Get the field values for pickling, in slot order.
+
+        Returns:
+            Tuple[Any, ...]: The field values.
+        """
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """
+        Restore the field values when unpickling, bypassing the frozen __setattr__.
+
+        Parameters:
+            state (Tuple[Any, ...]): The field values in slot order.
+        """
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
-    def __init__(self, config_file: str = "config.yaml") -> None:
+    @classmethod
+    def from_yaml(cls, config_file: str = "config.yaml") -> "ConfigManager":
         """
-        Initialize ConfigManager by loading and parsing the given YAML configuration file.
+        Create a ConfigManager by loading and parsing the given YAML configuration file.
 
-        This implementation checks that the file exists, safely loads it, extracts the analysis_settings
-        section, and sets each expected key as a typed attribute on the instance.
+        This implementation checks that the file exists, loads it from a JSON cache when that cache is at least
+        as new as the file, otherwise safely parses it (through libyaml when available) and refreshes the
+        cache, then extracts the analysis_settings section, converts list-valued sizes to tuples once, and
+        builds the frozen settings instance.
 
         Parameters:
             config_file (str): The path to the YAML configuration file.
 
+        Returns:
+            ConfigManager: The loaded settings.
+
         Raises:
             FileNotFoundError: If the specified configuration file does not exist.
         """
         if not os.path.isfile(config_file):
             raise FileNotFoundError("Failed to load config.yaml: " + config_file)
 
-        with open(config_file, "r") as f:
-            config_data = yaml.safe_load(f)
+        config_data = cls._load_json_cache(config_file)
+
+        if config_data is None:
+            with open(config_file, "rb") as f:
+                config_data = yaml.load(f, Loader=_YAML_LOADER)
+
+            cls._write_json_cache(config_file, config_data)
 
         settings = config_data["analysis_settings"]
 
-        self.video_source = settings["video_source"]
+        # Fill every field by name, converting list-valued sizes to tuples
+        return cls(
+            **{
+                name: tuple(settings[name]) if name in _TUPLE_FIELDS else settings[name]
+                for name in cls.__slots__
+            }
+        )
 
-        self.yolo_path = settings["yolo_path"]
-        self.ev_jar_path = settings["ev_jar_path"]
-        self.ev_class_path = settings["ev_class_path"]
+    @staticmethod
+    def _cache_path(config_file: str) -> str:
+        """
+        Get the path of the JSON cache kept beside a configuration file.
 
-        self.inference_interval = settings["inference_interval"]
+        Parameters:
+            config_file (str): The path to the YAML configuration file.
+
+        Returns:
+            str: The path to the JSON cache.
+        """
+        return config_file + ".jsoncache"
 
-        self.overlap_threshold = settings["overlap_threshold"]
-        self.iou_threshold = settings["iou_threshold"]
-        self.confidence_threshold = settings["confidence_threshold"]
+    @classmethod
+    def _load_json_cache(cls, config_file: str) -> Optional[Dict[str, Any]]:
+        """
+        Load previously parsed configuration data from the JSON cache if it is still fresh.
 
-        self.confirmation_frames = settings["confirmation_frames"]
-        self.removal_frames = settings["removal_frames"]
+        Parameters:
+            config_file (str): The path to the YAML configuration file.
 
-        self.inference_frame_size = tuple(settings["inference_frame_size"])
-        self.annotation_frame_size = tuple(settings["annotation_frame_size"])
-        self.window_frame_size = tuple(settings["window_frame_size"])
-        self.window_name = settings["window_name"]
+        Returns:
+            Optional[Dict[str, Any]]: The cached configuration data, or None if the cache is missing, older
+            than the configuration file, or unreadable.
+        """
+        cache_path = cls._cache_path(config_file)
 
-        self.deck_count = settings["deck_count"]
+        try:
+            if os.path.getmtime(cache_path) < os.path.getmtime(config_file):
+                return None
+
+            with open(cache_path, "rb") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def _write_json_cache(cls, config_file: str, config_data: Dict[str, Any]) -> None:
+        """
+        Write parsed configuration data to the JSON cache, ignoring failures since the cache is optional.
+
+        Parameters:
+            config_file (str): The path to the YAML configuration file.
+            config_data (Dict[str, Any]): The parsed configuration data.
+        """
+        try:
+            with open(cls._cache_path(config_file), "w") as f:
+                json.dump(config_data, f)
+        except (OSError, TypeError, ValueError):
+            pass
@@ -1,10 +1,11 @@
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import threading
 import time
 import queue
 
 import cv2
+import numpy as np
 
 from psrc.core.interfaces.i_card_deck import ICardDeck
 from psrc.core.interfaces.i_card_detector import ICardDetector
@@ -25,7 +26,8 @@ class AnalysisEngine:
     capture thread continuously reads frames and enqueues them; the analysis thread wakes at a fixed interval
     to dequeue a frame, perform card detection, tracking, hand grouping, and EV calculations, then enqueues the
     results; the display thread dequeues processed data, annotates the frame, and updates the UI. Thread-safe
-    queues are used to transfer data between threads.
+    queues are used to transfer data between threads, and a shared stop event shuts every stage down as soon
+    as any one of them ends or fails.
     """
 
     def __init__(
@@ -39,8 +41,12 @@ class AnalysisEngine:
         annotator: IFrameAnnotator,
         display: IDisplay,
         inference_interval: float = 0.25,
+        inference_batch_size: int = 1,
         inference_frame_size: Tuple[int, int] = (1280, 720),
         annotation_frame_size: Tuple[int, int] = (1280, 720),
+        use_opencl: bool = False,
+        scene_change_bits: int = 0,
+        scene_max_skips: int = 5,
     ) -> None:
         """
         Initialize AnalysisEngine with all pipeline components and settings.
@@ -56,8 +62,15 @@ class AnalysisEngine:
           display (IDisplay): The display interface for showing annotated frames and handling user input.
 
           inference_interval (float): The minimum time (in seconds) between inference steps.
+          inference_batch_size (int): The maximum number of frames passed to the detector in one call. The
+          detector must accept batches of this size, so CardDetector exports tensorrt and openvino models for it.
           inference_frame_size (Tuple[int, int]): The resolution for inference processing.
           annotation_frame_size (Tuple[int, int]): The resolution for display output.
+          use_opencl (bool): Whether to resize frames through OpenCL (cv2.UMat) when a device is available.
+          scene_change_bits (int): The number of scene hash bits that must differ from the last detected frame
+          before detection runs again (0 runs detection on every frame).
+          scene_max_skips (int): The most consecutive inference steps that may reuse the last detections before
+          detection is forced to run again.
         """
         # Core components
         self.video_reader = video_reader
@@ -71,15 +84,47 @@ class AnalysisEngine:
 
         # Timing & sizes
         self.inference_interval = inference_interval
+        self.inference_batch_size = max(1, inference_batch_size)
         self.inference_frame_size = inference_frame_size
         self.annotation_frame_size = annotation_frame_size
 
+        # Scale from inference coordinates to annotation coordinates, fixed for the engine's lifetime
+        self.annotation_scale = (
+            annotation_frame_size[0] / inference_frame_size[0],
+            annotation_frame_size[1] / inference_frame_size[1],
+        )
+        self._box_scale = np.array(
+            [self.annotation_scale[0], self.annotation_scale[1]] * 2, dtype=np.float64
+        )
+
+        # Resize backend
+        self.use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(self.use_opencl)
+
+        # Inference frames never leave the analysis thread, so their resize destinations are allocated once
+        inference_w, inference_h = inference_frame_size
+        self._inference_buffers = [
+            np.empty((inference_h, inference_w, 3), dtype=np.uint8)
+            for _ in range(self.inference_batch_size)
+        ]
+
         # Queues for thread data
         self.frame_queue: queue.Queue[Optional[Any]] = queue.Queue(maxsize=1)
         self.data_queue: queue.Queue[Optional[Tuple]] = queue.Queue(maxsize=1)
 
+        # Scene hash of the last detected frame and its detections, reused while the picture is unchanged
+        self.scene_change_bits = scene_change_bits
+        self.scene_max_skips = max(0, scene_max_skips)
+        self._skipped_detections = 0
+        self._last_scene_hash: Optional[np.ndarray] = None
+        self._last_detections: Dict[Tuple, Dict[str, Any]] = {}
+
+        # Last analysed tracks/deck state and its hands, reused while the scene is unchanged
+        self._last_state_key: Optional[Tuple] = None
+        self._last_hands: Dict[int, Dict[str, Any]] = {}
+
         # Control
-        self.running = False
+        self.stop_event = threading.Event()
         self.last_inference = time.monotonic() - inference_interval
 
     def _capture_loop(self) -> None:
@@ -94,57 +139,107 @@ class AnalysisEngine:
         fps = self.video_reader.get_fps()
         period = 1.0 / fps
 
-        while self.running:
-            start = time.monotonic()
+        next_deadline = time.monotonic() + period
+
+        while not self.stop_event.is_set():
             frame = self.video_reader.read_frame()
 
             if frame is None:
-                self.running = False
+                self.stop_event.set()
                 break
 
             self._enqueue_safe(self.frame_queue, frame)
-            time.sleep(max(0.0, period - (time.monotonic() - start)))
+
+            # Pace against a fixed schedule with one clock read, resyncing if the source falls behind
+            now = time.monotonic()
+
+            if now < next_deadline:
+                time.sleep(next_deadline - now)
+                next_deadline += period
+            else:
+                next_deadline = now + period
 
         logger.info("Capture Thread Stopped")
 
     def _analysis_loop(self) -> None:
         """
-        Pull the latest raw frame, run detection, tracking, hand grouping, and EV evaluation, then enqueue the
-        processed frame and metadata for display.
+        Sleep until the next inference slot, pull a batch of the latest raw frames, run batched detection (or
+        reuse the last detections when the scene hash shows the picture has not changed), track each frame's
+        detections in order, then run hand grouping (reusing the previous hands when tracks and deck are
+        unchanged) and EV evaluation, and enqueue the newest frame, resized for annotation, with its metadata
+        for display.
 
         Returns:
             None
         """
         logger.info("Starting Analysis Thread")
 
-        while self.running:
-            now = time.monotonic()
+        # Bind the per-iteration lookups once; components and settings are fixed for the engine's lifetime
+        stop_event = self.stop_event
+        monotonic = time.monotonic
+        interval = self.inference_interval
+        batch_size = self.inference_batch_size
+        frame_queue = self.frame_queue
+        data_queue = self.data_queue
+        deck = self.deck
+        update_tracks = self.card_tracker.update
+        update_hands = self.hand_tracker.update
+        evaluate_hands = self.hand_evaluator.evaluate_hands
+
+        while not stop_event.is_set():
+            # Sleep until the next inference slot instead of spinning; a stop request ends the wait early
+            remaining = self.last_inference + interval - monotonic()
+
+            if remaining > 0 and stop_event.wait(remaining):
+                break
 
-            if now - self.last_inference < self.inference_interval:
-                continue
+            now = monotonic()
 
-            frame = self._dequeue_safe(self.frame_queue)
+            frames = self._dequeue_batch(frame_queue, batch_size, interval)
 
-            if frame is None:
+            if not frames:
                 continue
 
-            inference_frame = cv2.resize(frame, self.inference_frame_size)
+            inference_frames, annotation_frame = self._resize_frames(frames)
+
+            # Detect the whole batch in one call, then feed the tracker in capture order
+            batch_detections = self._detect_batch(inference_frames)
 
-            detections = self.card_detector.detect(inference_frame)
-            tracks = self.card_tracker.update(detections)
-            hands = self.hand_tracker.update(tracks)
-            evals = self.hand_evaluator.evaluate_hands(hands)
-            deck = self.deck.cards
+            for detections in batch_detections:
+                tracks = update_tracks(detections)
+
+            # Hands depend only on the tracks and deck, so reuse them when neither has changed
+            state_key = (
+                tuple(
+                    (
+                        track_id,
+                        tuple(tr_meta["bbox"]),
+                        tr_meta["label"],
+                        tr_meta["state"],
+                    )
+                    for track_id, tr_meta in tracks.items()
+                ),
+                deck.version,
+            )
+
+            if state_key != self._last_state_key:
+                self._last_hands = update_hands(tracks)
+                self._last_state_key = state_key
+
+            # Query the evaluator every step: a synchronous one returns cached results for unchanged hands, and
+            # an asynchronous one may have finished a newer evaluation since the last step
+            hands = self._last_hands
+            evals = evaluate_hands(hands)
 
             self._enqueue_safe(
-                self.data_queue,
+                data_queue,
                 (
-                    inference_frame,
+                    annotation_frame,
                     detections,
                     tracks,
                     hands,
                     evals,
-                    deck,
+                    deck.cards,
                 ),
             )
 
@@ -154,19 +249,30 @@ class AnalysisEngine:
 
     def _display_loop(self) -> None:
         """
-        Pull processed frames, annotate them, render via display, and exit on user input.
+        Pull processed frames, scale their boxes to the annotation size, annotate them, render via display,
+        and exit on user input.
 
         Returns:
             None
         """
         logger.info("Starting Display Thread")
 
-        while self.running:
-            if not self.display.process_events():
-                self.running = False
+        # Bind the per-iteration lookups once; components and settings are fixed for the engine's lifetime
+        stop_event = self.stop_event
+        data_queue = self.data_queue
+        process_events = self.display.process_events
+        update_display = self.display.update
+        annotate = self.annotator.annotate
+
+        # Boxes are already in annotation coordinates when both sizes match
+        unscaled = self.annotation_scale == (1.0, 1.0)
+
+        while not stop_event.is_set():
+            if not process_events():
+                stop_event.set()
                 break
 
-            bundle = self._dequeue_safe(self.data_queue)
+            bundle = self._dequeue_safe(data_queue)
 
             if bundle is None:
                 continue
@@ -180,43 +286,14 @@ class AnalysisEngine:
                 deck,
             ) = bundle
 
-            h_inf, w_inf = frame.shape[:2]
-            w_disp, h_disp = self.annotation_frame_size
-            scale_x, scale_y = w_disp / w_inf, h_disp / h_inf
-
-            resized_frame = cv2.resize(frame, (w_disp, h_disp))
-
-            scaled_detections = {}
-            for raw_bbox, det_meta in detections.items():
-                x1, y1, x2, y2 = map(int, raw_bbox)
-                scaled_box = (
-                    int(x1 * scale_x),
-                    int(y1 * scale_y),
-                    int(x2 * scale_x),
-                    int(y2 * scale_y),
-                )
-                new_meta = det_meta.copy()
-                scaled_detections[scaled_box] = new_meta
-
-            scaled_tracks = {}
-            for track_id, tr_meta in tracks.items():
-                raw_bbox = tr_meta["bbox"]
-                x1, y1, x2, y2 = map(int, raw_bbox)
-                scaled_box = (
-                    int(x1 * scale_x),
-                    int(y1 * scale_y),
-                    int(x2 * scale_x),
-                    int(y2 * scale_y),
-                )
-                new_meta = tr_meta.copy()
-                new_meta["bbox"] = scaled_box
-                scaled_tracks[track_id] = new_meta
-
-            annotated_frame = self.annotator.annotate(
-                resized_frame, scaled_detections, scaled_tracks
-            )
+            if unscaled:
+                scaled_detections, scaled_tracks = detections, tracks
+            else:
+                scaled_detections, scaled_tracks = self._scale_boxes(detections, tracks)
+
+            annotated_frame = annotate(frame, scaled_detections, scaled_tracks)
 
-            self.display.update(
+            update_display(
                 frame=annotated_frame,
                 tracks=tracks,
                 hands=hands,
@@ -226,10 +303,201 @@ class AnalysisEngine:
 
         logger.info("Display Thread Stopped")
 
+    def _detect_batch(
+        self, inference_frames: List[Any]
+    ) -> List[Dict[Tuple, Dict[str, Any]]]:
+        """
+        Detect cards in a batch of inference frames, skipping the detector while the scene is unchanged.
+
+        When scene gating is enabled, the newest frame's scene hash is compared with the hash of the last frame
+        that went through the detector. If fewer than scene_change_bits bits differ, the last detections are
+        repeated for every frame, so tracks keep confirming and aging exactly as if the detector had run. The
+        detector still runs after scene_max_skips consecutive reused steps, so a change too small for the hash
+        (such as a card dealt onto another) is picked up within a bounded delay.
+
+        Parameters:
+            inference_frames (List[Any]): The inference-size frames in capture order.
+
+        Returns:
+            List[Dict[Tuple, Dict[str, Any]]]: The detections of each frame, in capture order.
+        """
+        if self.scene_change_bits <= 0:
+            return self.card_detector.detect_batch(inference_frames)
+
+        scene_hash = self._scene_hash(inference_frames[-1])
+
+        if (
+            self._last_scene_hash is not None
+            and self._skipped_detections < self.scene_max_skips
+            and np.count_nonzero(scene_hash != self._last_scene_hash)
+            < self.scene_change_bits
+        ):
+            self._skipped_detections += 1
+            return [self._last_detections] * len(inference_frames)
+
+        batch_detections = self.card_detector.detect_batch(inference_frames)
+        self._skipped_detections = 0
+        self._last_scene_hash = scene_hash
+        self._last_detections = batch_detections[-1]
+
+        return batch_detections
+
+    @staticmethod
+    def _scene_hash(frame: Any) -> np.ndarray:
+        """
+        Compute an average hash of a frame: a 32x18 grayscale thumbnail thresholded at its mean brightness.
+
+        Parameters:
+            frame (Any): The BGR frame to hash.
+
+        Returns:
+            np.ndarray: A (18, 32) boolean array, True where a thumbnail cell is brighter than the mean.
+        """
+        thumbnail = cv2.cvtColor(
+            cv2.resize(frame, (32, 18), interpolation=cv2.INTER_AREA),
+            cv2.COLOR_BGR2GRAY,
+        )
+        return thumbnail > thumbnail.mean()
+
+    def _scale_boxes(
+        self,
+        detections: Dict[Tuple, Dict[str, Any]],
+        tracks: Dict[int, Dict[str, Any]],
+    ) -> Tuple[Dict[Tuple, Dict[str, Any]], Dict[int, Dict[str, Any]]]:
+        """
+        Scale detection and track boxes from inference coordinates to annotation coordinates.
+
+        All boxes are stacked into one array and scaled with a single vectorized multiply, truncating to
+        integer pixels before and after scaling. Detection metadata is shared rather than copied, since
+        annotators treat it as read-only; track metadata is shallow-copied to carry the scaled box.
+
+        Parameters:
+          detections (Dict[Tuple, Dict[str, Any]]): A mapping of bounding box coordinates to their detection
+          information.
+          tracks (Dict[int, Dict[str, Any]]): A mapping of track IDs to their tracking information.
+
+        Returns:
+            Tuple[Dict[Tuple, Dict[str, Any]], Dict[int, Dict[str, Any]]]: The detections keyed by scaled
+            boxes and the tracks with scaled "bbox" entries.
+        """
+        boxes = np.array(
+            [*detections, *(tr_meta["bbox"] for tr_meta in tracks.values())],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        scaled = (boxes.astype(np.int64) * self._box_scale).astype(np.int64).tolist()
+
+        n_detections = len(detections)
+
+        scaled_detections = {
+            tuple(box): det_meta
+            for box, det_meta in zip(scaled[:n_detections], detections.values())
+        }
+        scaled_tracks = {
+            track_id: {**tr_meta, "bbox": tuple(box)}
+            for box, (track_id, tr_meta) in zip(scaled[n_detections:], tracks.items())
+        }
+
+        return scaled_detections, scaled_tracks
+
+    def _resize_frames(self, frames: List[Any]) -> Tuple[List[Any], Any]:
+        """
+        Resize raw frames to the inference size, and the newest one to the annotation size as well.
+
+        Both sizes are produced straight from the source frame, so the annotated frame is never upscaled from
+        the inference copy. With OpenCL enabled, each source frame is uploaded once as a cv2.UMat, resized on
+        the device, and only the results are downloaded. Otherwise inference frames are resized into buffers
+        preallocated at startup, which are overwritten by the next batch, and frames already at a target size
+        are passed through without resizing.
+
+        Parameters:
+          frames (List[Any]): The raw frames in capture order.
+
+        Returns:
+            Tuple[List[Any], Any]: The inference-size frames and the annotation-size copy of the newest frame.
+        """
+        if self.use_opencl:
+            h, w = frames[-1].shape[:2]
+            inference_interpolation = self._interpolation(
+                w, h, self.inference_frame_size
+            )
+            annotation_interpolation = self._interpolation(
+                w, h, self.annotation_frame_size
+            )
+
+            sources = [cv2.UMat(frame) for frame in frames]
+            inference_frames = [
+                cv2.resize(
+                    source,
+                    self.inference_frame_size,
+                    interpolation=inference_interpolation,
+                ).get()
+                for source in sources
+            ]
+            annotation_frame = cv2.resize(
+                sources[-1],
+                self.annotation_frame_size,
+                interpolation=annotation_interpolation,
+            ).get()
+        else:
+            inference_frames = [
+                self._resize_cpu(frame, self.inference_frame_size, buffer)
+                for frame, buffer in zip(frames, self._inference_buffers)
+            ]
+
+            # The annotation frame is handed to the display thread, so it never lands in a reused buffer
+            annotation_frame = self._resize_cpu(frames[-1], self.annotation_frame_size)
+
+        return inference_frames, annotation_frame
+
+    def _resize_cpu(
+        self, frame: Any, size: Tuple[int, int], dst: Optional[Any] = None
+    ) -> Any:
+        """
+        Resize a frame on the CPU with direction-appropriate interpolation, returning it unchanged when it
+        already has the requested size.
+
+        Parameters:
+          frame (Any): The frame to resize.
+          size (Tuple[int, int]): The target width and height.
+          dst (Optional[Any]): A preallocated destination array, or None to allocate a new one.
+
+        Returns:
+            Any: The resized frame, or the input frame if no resize was needed.
+        """
+        h, w = frame.shape[:2]
+
+        if w == size[0] and h == size[1]:
+            return frame
+
+        return cv2.resize(
+            frame, size, dst=dst, interpolation=self._interpolation(w, h, size)
+        )
+
+    @staticmethod
+    def _interpolation(w: int, h: int, size: Tuple[int, int]) -> int:
+        """
+        Choose the OpenCV interpolation for resizing a w x h frame to size.
+
+        Area averaging gives the cleanest downscale but is only as fast as bilinear on OpenCV's exact 2x
+        shrink path; at fractional ratios it costs several times more, so bilinear is used everywhere else.
+
+        Parameters:
+          w (int): The source width in pixels.
+          h (int): The source height in pixels.
+          size (Tuple[int, int]): The target width and height.
+
+        Returns:
+            int: INTER_AREA for an exact 2x shrink, otherwise INTER_LINEAR.
+        """
+        if size[0] * 2 == w and size[1] * 2 == h:
+            return cv2.INTER_AREA
+
+        return cv2.INTER_LINEAR
+
     def _enqueue_safe(self, q: queue.Queue, item: Any) -> None:
         """
-        Safely enqueue item into q. If the queue is full, the oldest element is discarded before enqueuing the
-        new one.
+        Safely enqueue item into q without blocking. If the queue is full, the oldest element is discarded and
+        the put is retried.
 
         Parameters:
           q (queue.Queue): The target queue.
@@ -238,11 +506,16 @@ class AnalysisEngine:
         Returns:
             None
         """
-        try:
-            q.put(item, timeout=0.01)
-        except queue.Full:
-            _ = q.get_nowait()
-            q.put(item)
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                # Drop the stale item; another consumer may have taken it already
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
 
     def _dequeue_safe(self, q: queue.Queue) -> Any:
         """
@@ -259,6 +532,60 @@ class AnalysisEngine:
         except queue.Empty:
             return None
 
+    def _dequeue_batch(self, q: queue.Queue, size: int, timeout: float) -> List[Any]:
+        """
+        Dequeue up to size items from q. The first item is awaited for up to timeout seconds; once it arrives,
+        further items are awaited until the batch is full or another timeout seconds have elapsed, whichever
+        comes first.
+
+        Parameters:
+          q (queue.Queue): The target queue.
+          size (int): The maximum number of items to dequeue.
+          timeout (float): The maximum time (in seconds) to wait for the first item and for the batch to fill.
+
+        Returns:
+            List[Any]: The dequeued items in arrival order, or an empty list if the queue was empty.
+        """
+        # Block for the first item, bounded so the caller can still notice a stop request
+        try:
+            first = q.get(timeout=max(timeout, 0.01))
+        except queue.Empty:
+            return []
+
+        items = [first]
+        deadline = time.monotonic() + timeout
+
+        while len(items) < size:
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                break
+
+            try:
+                items.append(q.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return items
+
+    def _run_stage(self, loop: Callable[[], None]) -> None:
+        """
+        Run a pipeline stage loop and signal every other stage to stop once it exits, whether it finished
+        normally or raised.
+
+        Parameters:
+          loop (Callable[[], None]): The stage loop to run.
+
+        Returns:
+            None
+        """
+        try:
+            loop()
+        except Exception:
+            logger.exception("Pipeline stage %s failed", loop.__name__)
+        finally:
+            self.stop_event.set()
+
     def start(self) -> None:
         """
         Start capture, analysis, and display threads. Blocks all threads until completion.
@@ -268,12 +595,12 @@ class AnalysisEngine:
         """
         logger.info("Starting AnalysisEngine")
 
-        self.running = True
+        self.stop_event.clear()
 
         threads = [
-            threading.Thread(target=self._capture_loop),
-            threading.Thread(target=self._analysis_loop),
-            threading.Thread(target=self._display_loop),
+            threading.Thread(target=self._run_stage, args=(self._capture_loop,)),
+            threading.Thread(target=self._run_stage, args=(self._analysis_loop,)),
+            threading.Thread(target=self._run_stage, args=(self._display_loop,)),
         ]
 
         for t in threads:
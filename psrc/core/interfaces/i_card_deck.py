@@ -1,13 +1,50 @@
 from abc import ABC, abstractmethod
 
+from typing import Dict, Sequence
+
 
 class ICardDeck(ABC):
     """
     Interface for managing a blackjack card deck.
 
-    This interface defines a contract for updating a card deck by adding or removing cards.
+    This interface defines a contract for updating a card deck by adding or removing cards, for exposing the
+    remaining counts both as a fixed-size count vector and as a dict, and for exposing a version number that
+    changes whenever the deck composition does.
     """
 
+    @property
+    @abstractmethod
+    def counts(self) -> Sequence[int]:
+        """
+        Get the remaining count of each card label.
+
+        Returns:
+            Sequence[int]: The counts indexed by label 0-9.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def cards(self) -> Dict[int, int]:
+        """
+        Get the remaining count of each card label as a dict.
+
+        Returns:
+            Dict[int, int]: A mapping of card label to count.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """
+        Get the deck version, which increases every time a card is added or removed.
+
+        Returns:
+            int: The current deck version.
+        """
+        pass
+
     @abstractmethod
     def add_card(self, card_label: int) -> bool:
         """
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 
 class ICardDetector(ABC):
@@ -22,3 +22,17 @@ class ICardDetector(ABC):
             Dict[Tuple, Dict[str, Any]]: A mapping of bounding box coordinates to their detection information.
         """
         pass
+
+    @abstractmethod
+    def detect_batch(self, frames: List[Any]) -> List[Dict[Tuple, Dict[str, Any]]]:
+        """
+        Detect cards within a batch of frames.
+
+        Parameters:
+            frames (List[Any]): The frames in which to detect.
+
+        Returns:
+            List[Dict[Tuple, Dict[str, Any]]]: One mapping of bounding box coordinates to detection information
+            per input frame, in the same order as the frames.
+        """
+        pass
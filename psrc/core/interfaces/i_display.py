@@ -25,6 +25,8 @@ class IDisplay(ABC):
         """
         Update any subset of the display state.
 
+        The frame is taken by reference, so callers must not modify it after passing it in.
+
         Parameters:
             frame (Any, optional): The frame for display.
             detections (Dict[Tuple, Dict[str, Any]], optional): A mapping of bounding box coordinates to their
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from typing import Dict, List
+from typing import Dict, List, Sequence
 
 
 class IExpectedValueCalculator(ABC):
@@ -8,18 +8,19 @@ class IExpectedValueCalculator(ABC):
     Interface for calculating expected values of blackjack actions.
 
     This interface defines a contract for calculating expected values for standing, hitting, doubling,
-    splitting, and surrendering based on deck and hand compositions.
+    splitting, and surrendering based on deck and hand compositions, either per action or for a batch of hands
+    at once.
     """
 
     @abstractmethod
     def calculate_stand_ev(
-        self, deck: Dict[int, int], player_hand: List[int], dealer_hand: List[int]
+        self, deck: Sequence[int], player_hand: List[int], dealer_hand: List[int]
     ) -> float:
         """
         Calculate the expected value when the player stands.
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
             player_hand (List[int]): A list of card labels in the player's hand.
             dealer_hand (List[int]): A list of card labels in the dealer's hand.
 
@@ -30,13 +31,13 @@ class IExpectedValueCalculator(ABC):
 
     @abstractmethod
     def calculate_hit_ev(
-        self, deck: Dict[int, int], player_hand: List[int], dealer_hand: List[int]
+        self, deck: Sequence[int], player_hand: List[int], dealer_hand: List[int]
     ) -> float:
         """
         Calculate the expected value when the player hits.
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
             player_hand (List[int]): A list of card labels in the player's hand.
             dealer_hand (List[int]): A list of card labels in the dealer's hand.
 
@@ -47,13 +48,13 @@ class IExpectedValueCalculator(ABC):
 
     @abstractmethod
     def calculate_double_ev(
-        self, deck: Dict[int, int], player_hand: List[int], dealer_hand: List[int]
+        self, deck: Sequence[int], player_hand: List[int], dealer_hand: List[int]
     ) -> float:
         """
         Calculate the expected value when the player doubles.
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
             player_hand (List[int]): A list of card labels in the player's hand.
             dealer_hand (List[int]): A list of card labels in the dealer's hand.
 
@@ -64,13 +65,13 @@ class IExpectedValueCalculator(ABC):
 
     @abstractmethod
     def calculate_split_ev(
-        self, deck: Dict[int, int], player_hand: List[int], dealer_hand: List[int]
+        self, deck: Sequence[int], player_hand: List[int], dealer_hand: List[int]
     ) -> float:
         """
         Calculate the expected value when the player splits.
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
             player_hand (List[int]): A list of card labels in the player's hand.
             dealer_hand (List[int]): A list of card labels in the dealer's hand.
 
@@ -79,15 +80,36 @@ class IExpectedValueCalculator(ABC):
         """
         pass
 
+    @abstractmethod
+    def calculate_all_evs(
+        self,
+        deck: Sequence[int],
+        player_hands: List[List[int]],
+        dealer_hand: List[int],
+    ) -> List[Dict[str, float]]:
+        """
+        Calculate the expected values of every action for several player hands against one dealer hand.
+
+        Parameters:
+            deck (Sequence[int]): The remaining count of each card label 0-9.
+            player_hands (List[List[int]]): A list of player hands, each a list of card labels.
+            dealer_hand (List[int]): A list of card labels in the dealer's hand.
+
+        Returns:
+            List[Dict[str, float]]: One dict per player hand, in input order, mapping "stand", "hit", "double",
+            "split", and "surrender" to their expected values.
+        """
+        pass
+
     @abstractmethod
     def calculate_surrender_ev(
-        self, deck: Dict[int, int], player_hand: List[int], dealer_hand: List[int]
+        self, deck: Sequence[int], player_hand: List[int], dealer_hand: List[int]
     ) -> float:
         """
         Calculate the expected value when the player surrenders.
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
             player_hand (List[int]): A list of card labels in the player's hand.
             dealer_hand (List[int]): A list of card labels in the dealer's hand.
 
@@ -20,8 +20,11 @@ class IFrameAnnotator(ABC):
         """
         Annotate a frame with detection and tracking information.
 
+        Implementations may draw directly onto the given frame and return it, so callers must pass a frame they
+        own and hand a separate copy to any consumer that needs the unannotated pixels.
+
         Parameters:
-            frame (Any): The frame to annotate.
+            frame (Any): The frame to annotate, which may be modified in place.
             detections (Dict[Tuple, Dict[str, Any]]): A mapping of bounding box coordinates to their detection
             information.
             tracks (Dict[int, Dict[str, Any]]): A mapping of track IDs to their tracking information.
@@ -7,8 +7,8 @@ class IHandEvaluator(ABC):
     """
     Interface for evaluating grouped blackjack hands.
 
-    This interface defines a contract for computing expected values for each possible player action and
-    choosing the best action.
+    This interface defines a contract for computing expected values for each possible player action,
+    choosing the best action, and releasing any evaluator resources.
     """
 
     @abstractmethod
@@ -25,3 +25,10 @@ class IHandEvaluator(ABC):
             Dict[str, Dict[str, Any]]: A mapping of hand IDs to their evaluation information.
         """
         pass
+
+    @abstractmethod
+    def release(self) -> None:
+        """
+        Release evaluator resources.
+        """
+        pass
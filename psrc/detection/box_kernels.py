@@ -0,0 +1,169 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def iou_matrix(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Compute the Intersection over Union (IoU) between two box sets.
+
+    This kernel fills the (N, M) IoU matrix in a single compiled double loop, without allocating any broadcast
+    temporaries, and releases the GIL while running.
+
+    Parameters:
+        boxes1 (np.ndarray): An array of bounding boxes (shape: [N, 4]).
+        boxes2 (np.ndarray): An array of bounding boxes (shape: [M, 4]).
+
+    Returns:
+        np.ndarray: An IoU matrix of shape (N, M).
+    """
+    n = boxes1.shape[0]
+    m = boxes2.shape[0]
+    iou = np.zeros((n, m), dtype=boxes1.dtype)
+
+    for i in range(n):
+        ax1, ay1, ax2, ay2 = boxes1[i, 0], boxes1[i, 1], boxes1[i, 2], boxes1[i, 3]
+        area1 = (ax2 - ax1) * (ay2 - ay1)
+
+        for j in range(m):
+            bx1, by1, bx2, by2 = boxes2[j, 0], boxes2[j, 1], boxes2[j, 2], boxes2[j, 3]
+
+            # Intersection rectangle, clamped to zero when the boxes do not overlap
+            inter_w = min(ax2, bx2) - max(ax1, bx1)
+            inter_h = min(ay2, by2) - max(ay1, by1)
+
+            if inter_w <= 0 or inter_h <= 0:
+                continue
+
+            inter = inter_w * inter_h
+            area2 = (bx2 - bx1) * (by2 - by1)
+            iou[i, j] = inter / (area1 + area2 - inter + 1e-6)
+
+    return iou
+
+
+@njit(cache=True, nogil=True)
+def _find_root(parent: np.ndarray, x: int) -> int:
+    """
+    Find the representative of the set containing x, compressing the path along the way.
+
+    Parameters:
+        parent (np.ndarray): The union-find parent array.
+        x (int): The element index.
+
+    Returns:
+        int: The index of the set representative.
+    """
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+@njit(cache=True, nogil=True)
+def overlap_groups(boxes: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Cluster boxes whose pairwise overlap ratio meets a threshold.
+
+    The overlap ratio of a pair is the intersection area over the smaller box's area. Every pair meeting the
+    threshold is merged with union-find, and the set representative of each box is returned, all in a single
+    compiled pass that releases the GIL.
+
+    Parameters:
+        boxes (np.ndarray): An array of bounding boxes (shape: [N, 4]).
+        threshold (float): The minimum overlap ratio for two boxes to be grouped together.
+
+    Returns:
+        np.ndarray: An array of shape (N,) holding the group representative index of each box.
+    """
+    n = boxes.shape[0]
+    parent = np.arange(n)
+
+    for i in range(n):
+        ax1, ay1, ax2, ay2 = boxes[i, 0], boxes[i, 1], boxes[i, 2], boxes[i, 3]
+        area1 = (ax2 - ax1) * (ay2 - ay1)
+
+        for j in range(i + 1, n):
+            bx1, by1, bx2, by2 = boxes[j, 0], boxes[j, 1], boxes[j, 2], boxes[j, 3]
+            area2 = (bx2 - bx1) * (by2 - by1)
+
+            inter_w = max(0.0, min(ax2, bx2) - max(ax1, bx1))
+            inter_h = max(0.0, min(ay2, by2) - max(ay1, by1))
+            overlap = inter_w * inter_h / (min(area1, area2) + 1e-6)
+
+            if overlap >= threshold:
+                root_i = _find_root(parent, i)
+                root_j = _find_root(parent, j)
+
+                if root_i != root_j:
+                    parent[root_j] = root_i
+
+    roots = np.empty(n, dtype=np.int64)
+
+    for i in range(n):
+        roots[i] = _find_root(parent, i)
+
+    return roots
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def nms(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """
+    Perform class-agnostic greedy non-maximum suppression.
+
+    Boxes are visited in descending score order, and each kept box suppresses every remaining box whose IoU
+    with it exceeds the threshold.
+
+    Parameters:
+        boxes (np.ndarray): An array of bounding boxes (shape: [N, 4]).
+        scores (np.ndarray): An array of confidence scores (shape: [N]).
+        iou_threshold (float): The IoU above which a lower-scoring box is suppressed.
+
+    Returns:
+        np.ndarray: The int32 indices of the kept boxes, in descending score order.
+    """
+    order = np.argsort(-scores)
+    n = order.shape[0]
+    suppressed = np.zeros(n, dtype=np.bool_)
+    keep = np.empty(n, dtype=np.int32)
+    count = 0
+
+    for a in range(n):
+        i = order[a]
+
+        if suppressed[i]:
+            continue
+
+        keep[count] = i
+        count += 1
+
+        ax1, ay1, ax2, ay2 = boxes[i, 0], boxes[i, 1], boxes[i, 2], boxes[i, 3]
+        area1 = (ax2 - ax1) * (ay2 - ay1)
+
+        for b in range(a + 1, n):
+            j = order[b]
+
+            if suppressed[j]:
+                continue
+
+            bx1, by1, bx2, by2 = boxes[j, 0], boxes[j, 1], boxes[j, 2], boxes[j, 3]
+
+            inter_w = min(ax2, bx2) - max(ax1, bx1)
+            inter_h = min(ay2, by2) - max(ay1, by1)
+
+            if inter_w <= 0 or inter_h <= 0:
+                continue
+
+            inter = inter_w * inter_h
+            area2 = (bx2 - bx1) * (by2 - by1)
+
+            if inter / (area1 + area2 - inter + 1e-6) > iou_threshold:
+                suppressed[j] = True
+
+    return keep[:count]
+
+
+# Warm the JIT once at import so the first tracked frame does not pay the compile cost
+iou_matrix(np.zeros((1, 4), dtype=np.float32), np.zeros((1, 4), dtype=np.float32))
+overlap_groups(np.zeros((1, 4), dtype=np.float64), 0.1)
+nms(np.zeros((1, 4), dtype=np.float32), np.zeros(1, dtype=np.float32), 0.5)
@@ -1,34 +1,162 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import hashlib
+import os
+import shutil
+
+import numpy as np
+import torch
 from ultralytics import YOLO
 
 from psrc.core.interfaces.i_card_detector import ICardDetector
+from psrc.detection.box_kernels import nms
 
 
 class CardDetector(ICardDetector):
     """
     CardDetector is an implementation of the ICardDetector interface.
 
-    This implementation wraps an Ultralytics YOLO model to run inference on individual frames and extract
-    bounding boxes, class labels, and confidence scores.
+    This implementation wraps an Ultralytics YOLO model to run inference on individual frames or batches of
+    frames and extract bounding boxes, class labels, and confidence scores. The model can optionally be
+    exported to a TensorRT or OpenVINO artifact at reduced precision, which is cached beside the weights.
+    YOLO suppresses overlaps per class only, so an optional class-agnostic NMS pass removes the same card
+    being detected under two labels.
+
+    Attributes:
+        BACKENDS (Dict[str, Tuple[str, str]]): The Ultralytics export format and artifact suffix per backend.
+        PRECISIONS (Tuple[str, ...]): The supported numeric precisions.
     """
 
-    def __init__(self, model_path: str) -> None:
+    BACKENDS: Dict[str, Tuple[str, str]] = {
+        "pytorch": ("", ""),
+        "tensorrt": ("engine", ".engine"),
+        "openvino": ("openvino", "_openvino_model"),
+    }
+    PRECISIONS: Tuple[str, ...] = ("fp32", "fp16", "int8")
+
+    def __init__(
+        self,
+        model_path: str,
+        backend: str = "pytorch",
+        precision: str = "fp32",
+        calibration_data: Optional[str] = None,
+        batch_size: int = 1,
+        nms_threshold: Optional[float] = None,
+        num_threads: Optional[int] = None,
+    ) -> None:
         """
         Initialize CardDetector with a YOLO model.
 
         Parameters:
             model_path (str): A filepath to pretrained YOLO weights.
+            backend (str): The inference backend, one of "pytorch", "tensorrt", or "openvino".
+            precision (str): The numeric precision, one of "fp32", "fp16", or "int8".
+            calibration_data (Optional[str]): A filepath to an Ultralytics dataset YAML of card images used to
+            calibrate an int8 export, required when precision is "int8".
+            batch_size (int): The largest number of frames passed to detect_batch in one call, which exported
+            models are built to accept.
+            nms_threshold (Optional[float]): The IoU above which class-agnostic NMS drops the lower-confidence
+            of two boxes, or None to keep every box returned by YOLO.
+            num_threads (Optional[int]): The number of intra-op CPU threads for PyTorch inference, or None to
+            keep the PyTorch default of one per core.
+
+        Raises:
+            ValueError: If the backend or precision is unknown, or int8 is requested with the pytorch backend or
+            without calibration data.
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown detector backend: {backend}")
+
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Unknown detector precision: {precision}")
+
+        if backend == "pytorch" and precision == "int8":
+            raise ValueError("int8 precision requires the tensorrt or openvino backend")
+
+        # Without card images, Ultralytics would calibrate the int8 export on its default COCO dataset
+        if precision == "int8" and not calibration_data:
+            raise ValueError("int8 precision requires a calibration dataset")
+
+        self.calibration_data = calibration_data
+        self.batch_size = max(1, batch_size)
+        self.nms_threshold = nms_threshold
+
+        # Cap PyTorch's CPU thread pool so inference leaves cores free for the capture and display stages
+        if num_threads is not None:
+            torch.set_num_threads(max(1, num_threads))
+
+        # PyTorch runs FP16 at predict time; exported backends have the precision baked into the artifact
+        self.half = backend == "pytorch" and precision == "fp16"
+
+        if backend == "pytorch":
+            self.model = YOLO(model_path)
+        else:
+            self.model = YOLO(
+                self._export_model(model_path, backend, precision), task="detect"
+            )
+
+    def _export_model(self, model_path: str, backend: str, precision: str) -> str:
+        """
+        Export the YOLO weights to the given backend and precision, reusing a previous export if it is at least
+        as new as the weights.
+
+        An int8 export is calibrated on the configured calibration dataset. When batches of more than one frame
+        are expected, the model is exported with a dynamic batch dimension up to batch_size, since a TensorRT
+        engine otherwise only accepts the fixed input shape it was built for. The artifact name records the
+        precision, batch size, and (for int8) a short hash of the calibration dataset path.
+
+        Parameters:
+            model_path (str): A filepath to pretrained YOLO weights.
+            backend (str): The export backend.
+            precision (str): The export precision.
+
+        Returns:
+            str: The filepath of the exported model artifact.
         """
-        self.model = YOLO(model_path)
+        export_format, suffix = self.BACKENDS[backend]
+        stem = os.path.splitext(model_path)[0]
+
+        # Tag int8 exports with their calibration dataset so a different dataset never loads a stale calibration
+        calibration_tag = ""
+
+        if precision == "int8":
+            digest = hashlib.md5(self.calibration_data.encode()).hexdigest()
+            calibration_tag = f"_{digest[:8]}"
+
+        artifact_path = (
+            f"{stem}_{precision}_b{self.batch_size}{calibration_tag}{suffix}"
+        )
+
+        # Export again when there is no artifact yet or the weights were replaced after it was built
+        is_stale = not os.path.exists(artifact_path) or (
+            os.path.getmtime(artifact_path) < os.path.getmtime(model_path)
+        )
+
+        if is_stale:
+            exported_path = YOLO(model_path).export(
+                format=export_format,
+                half=precision == "fp16",
+                int8=precision == "int8",
+                data=self.calibration_data if precision == "int8" else None,
+                dynamic=self.batch_size > 1,
+                batch=self.batch_size,
+            )
+
+            # OpenVINO exports are directories, which os.replace cannot overwrite
+            if os.path.isdir(artifact_path):
+                shutil.rmtree(artifact_path)
+
+            # Keep one artifact per precision and batch size so switching either never loads a stale export
+            os.replace(exported_path, artifact_path)
+
+        return artifact_path
 
     def detect(self, frame: Any) -> Dict[Tuple, Dict[str, Any]]:
         """
         Detect cards within a given frame.
 
-        This implementation runs the YOLO model on the provided frame, extracts the bounding boxes, class
-        indices, and confidence scores, converts them into Python-native lists, and returns the assembled
-        mapping.
+        This implementation runs the YOLO model on the provided frame and assembles the bounding boxes, class
+        indices, and confidence scores of the result into a mapping.
 
         Parameters:
             frame (Any): The frame in which to detect.
@@ -43,28 +171,69 @@ class CardDetector(ICardDetector):
                 - "label" (Optional[int]): Class index assigned by YOLO for this box, or None.
                 - "confidence" (float): Confidence score for this detection.
         """
-        # Run the YOLO model on the frame
-        results = self.model(frame, show=False)
-        # Use the first result which contains the detection data
-        last_results = results[0]
-        boxes, labels, confidences = [], [], []
+        # Run the YOLO model on the frame and use the first result which contains the detection data
+        results = self.model(frame, show=False, half=self.half)
+        return self._assemble_detections(results[0])
 
-        # Check if detection results and bounding boxes are available
-        if last_results is not None and last_results.boxes is not None:
-            boxes = last_results.boxes.xyxy.cpu().numpy().tolist()
-            confidences = last_results.boxes.conf.cpu().numpy().tolist()
+    def detect_batch(self, frames: List[Any]) -> List[Dict[Tuple, Dict[str, Any]]]:
+        """
+        Detect cards within a batch of frames.
+
+        This implementation runs the YOLO model once on the whole batch so that launch and postprocess overhead
+        is amortized across frames, then assembles the detections of each result in input order.
+
+        Parameters:
+            frames (List[Any]): The frames in which to detect.
+
+        Returns:
+            List[Dict[Tuple, Dict[str, Any]]]: One mapping of bounding box coordinates to detection information
+            per input frame, in the same order as the frames.
+        """
+        if not frames:
+            return []
+
+        results = self.model(frames, show=False, half=self.half)
+        return [self._assemble_detections(result) for result in results]
 
-            if hasattr(last_results.boxes, "cls"):
-                labels = last_results.boxes.cls.cpu().numpy().tolist()
+    def _assemble_detections(self, result: Any) -> Dict[Tuple, Dict[str, Any]]:
+        """
+        Convert a single YOLO result into a detection mapping.
 
-        # Dictionary to store current detection information
-        detections = {}
+        This method copies the result's box tensor to the host in a single transfer, splits it into bounding
+        boxes, confidence scores, and class indices, applies class-agnostic NMS when enabled, converts them into
+        Python-native lists, and builds the mapping from those parallel lists in a single comprehension.
 
-        for i in range(len(boxes)):
-            # Convert each box to a tuple to use as a key
-            detections[tuple(boxes[i])] = {
-                "label": labels[i] if i < len(labels) else None,
-                "confidence": confidences[i],
-            }
+        Parameters:
+            result (Any): A single Ultralytics result object.
 
-        return detections
+        Returns:
+            Dict[Tuple, Dict[str, Any]]: A mapping of bounding box coordinates to their detection information.
+        """
+        boxes, labels, confidences = [], [], []
+
+        # Check if detection results and bounding boxes are available
+        if result is not None and result.boxes is not None:
+            # Copy the box tensor to the host once; rows start with xyxy and end with confidence and class
+            data = result.boxes.data.cpu().numpy()
+            boxes_np = data[:, :4].astype(np.float32)
+            confidences_np = data[:, -2].astype(np.float32)
+            labels_np = data[:, -1]
+
+            # Drop cross-class duplicates of the same card with the compiled NMS kernel
+            if self.nms_threshold is not None and len(boxes_np) > 1:
+                keep = nms(boxes_np, confidences_np, self.nms_threshold)
+                boxes_np = boxes_np[keep]
+                confidences_np = confidences_np[keep]
+                labels_np = labels_np[keep]
+
+            boxes = boxes_np.tolist()
+            confidences = confidences_np.tolist()
+
+            # YOLO reports class indices as floats; cast them once so downstream code gets plain ints
+            labels = labels_np.astype(np.int64).tolist()
+
+        # Build the mapping in one pass over the parallel lists, keying each detection by its box tuple
+        return {
+            tuple(box): {"label": label, "confidence": confidence}
+            for box, label, confidence in zip(boxes, labels, confidences)
+        }
@@ -1,9 +1,10 @@
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 from scipy.optimize import linear_sum_assignment
 
 from psrc.core.interfaces.i_card_tracker import ICardTracker
+from psrc.detection.box_kernels import iou_matrix
 
 
 class TrackState:
@@ -120,8 +121,8 @@ class CardTracker(ICardTracker):
         """
         Compute the Intersection over Union (IoU) between two box sets.
 
-        This method handles reshaping of inputs, computes pairwise intersection areas, and divides by the union
-        areas to produce an IoU matrix.
+        This method reshapes the inputs to C-contiguous float32 (N, 4) arrays and delegates the pairwise
+        computation to the compiled iou_matrix kernel.
 
         Parameters:
             boxes1 (np.ndarray): An array of bounding boxes (shape: [N, 4]).
@@ -130,90 +131,76 @@ class CardTracker(ICardTracker):
         Returns:
             np.ndarray: An IoU matrix of shape (N, M).
         """
-        # Ensure boxes are 2-dimensional arrays (N, 4)
-        if boxes1.ndim != 2:
-            boxes1 = boxes1.reshape(-1, 4)
-        if boxes2.ndim != 2:
-            boxes2 = boxes2.reshape(-1, 4)
+        # Ensure boxes are C-contiguous 2-dimensional float32 arrays (N, 4), so the kernel always runs the same
+        # compiled specialization
+        boxes1 = np.ascontiguousarray(boxes1, dtype=np.float32).reshape(-1, 4)
+        boxes2 = np.ascontiguousarray(boxes2, dtype=np.float32).reshape(-1, 4)
 
         # Handle edge case where there are no boxes in one of the arrays
         if boxes1.shape[0] == 0 or boxes2.shape[0] == 0:
-            return np.zeros((boxes1.shape[0], boxes2.shape[0]))
+            return np.zeros((boxes1.shape[0], boxes2.shape[0]), dtype=np.float32)
 
-        # Compute the coordinates for the intersection rectangle
-        xA = np.maximum(boxes1[:, None, 0], boxes2[None, :, 0])
-        yA = np.maximum(boxes1[:, None, 1], boxes2[None, :, 1])
-        xB = np.minimum(boxes1[:, None, 2], boxes2[None, :, 2])
-        yB = np.minimum(boxes1[:, None, 3], boxes2[None, :, 3])
-
-        # Calculate area of intersection rectangle and handle negative values
-        interArea = np.maximum(0, xB - xA) * np.maximum(0, yB - yA)
-
-        # Compute individual box areas for union calculation
-        boxArea1 = (boxes1[:, 2] - boxes1[:, 0]) * (boxes1[:, 3] - boxes1[:, 1])
-        boxArea2 = (boxes2[:, 2] - boxes2[:, 0]) * (boxes2[:, 3] - boxes2[:, 1])
-
-        # Compute IoU using the formula: Intersection / (Area1 + Area2 - Intersection)
-        iou = interArea / (boxArea1[:, None] + boxArea2[None, :] - interArea + 1e-6)
-
-        return iou
+        return iou_matrix(boxes1, boxes2)
 
     def _data_association(
-        self, detection_boxes: List[Tuple[float, float, float, float]]
-    ) -> Tuple[Dict[int, int], Set[int]]:
+        self, det_boxes: np.ndarray
+    ) -> Tuple[Dict[int, int], List[int]]:
         """
-        Perform data association using the Hungarian algorithm on IoU cost.
+        Perform data association using the Hungarian algorithm on IoU.
 
-        This method converts IoU to a cost matrix (1 - IoU), solves the assignment problem, and then filters
-        matches below the IoU threshold. Unmatched detections are returned separately.
+        This method solves the assignment problem by maximizing total IoU, which is equivalent to minimizing a
+        1 - IoU cost, and then filters matches below the IoU threshold with one vectorized mask. The solver is
+        skipped when no pair reaches the threshold. Unmatched detections are returned separately.
 
         Parameters:
-            detection_boxes (List[Tuple[float, float, float, float]]): A list of bounding boxes.
+            det_boxes (np.ndarray): A float32 array of detection bounding boxes (shape: [N, 4]).
 
         Returns:
-            Tuple[Dict[int, int], Set[int]]: A mapping of track IDs to indices of detection boxes and a set of
+            Tuple[Dict[int, int], List[int]]: A mapping of track IDs to indices of detection boxes and a list of
             indices representing unmatched detections.
         """
-        # If there are no new detections, return empty assignments and an empty set for unmatched detections
-        if len(detection_boxes) == 0:
-            return {}, set()
+        n_detections = det_boxes.shape[0]
 
-        # Prepare arrays for existing track bounding boxes and new detection bounding boxes
-        track_boxes = np.array([track.bbox for track in self.tracks.values()])
-        det_boxes = np.array(detection_boxes).reshape(-1, 4)
+        # If there are no new detections, return empty assignments and no unmatched detections
+        if n_detections == 0:
+            return {}, []
+
+        # Prepare the existing track bounding boxes as one array
+        track_ids = np.fromiter(
+            self.tracks.keys(), dtype=np.int64, count=len(self.tracks)
+        )
+        track_boxes = np.array(
+            [track.bbox for track in self.tracks.values()], dtype=np.float32
+        ).reshape(-1, 4)
 
         # Compute the IoU matrix between each track and detection
         iou_matrix = self._compute_iou(track_boxes, det_boxes)
-        # Convert IoU to a cost matrix for minimization; lower cost means higher overlap
-        cost_matrix = 1 - iou_matrix
-
-        # Solve the assignment problem using the Hungarian algorithm (minimizes total cost)
-        row_ind, col_ind = linear_sum_assignment(cost_matrix)
-
-        assignments = {}  # To store valid assignments
-        unmatched_detections = set(
-            range(len(detection_boxes))
-        )  # Start with all detections as unmatched
-        track_ids = list(
-            self.tracks.keys()
-        )  # Get current track IDs to index into assignments
-
-        # Loop through each assignment provided by the algorithm
-        for r, c in zip(row_ind, col_ind):
-            # Only accept the assignment if the IoU meets or exceeds the threshold
-            if iou_matrix[r, c] >= self.iou_threshold:
-                track_id = track_ids[r]
-                assignments[track_id] = c
-                unmatched_detections.remove(c)
-
-        return assignments, unmatched_detections
+
+        # With no tracks, or no pair overlapping enough to match, every detection starts a new track
+        if iou_matrix.size == 0 or iou_matrix.max() < self.iou_threshold:
+            return {}, list(range(n_detections))
+
+        # Solve the assignment problem on the IoU directly; maximizing total IoU picks the same pairs as
+        # minimizing the 1 - IoU cost, without building the cost matrix
+        row_ind, col_ind = linear_sum_assignment(iou_matrix, maximize=True)
+
+        # Only accept the assignments whose IoU meets or exceeds the threshold
+        valid = iou_matrix[row_ind, col_ind] >= self.iou_threshold
+        matched_rows, matched_cols = row_ind[valid], col_ind[valid]
+
+        assignments = dict(zip(track_ids[matched_rows].tolist(), matched_cols.tolist()))
+
+        unmatched = np.ones(n_detections, dtype=np.bool_)
+        unmatched[matched_cols] = False
+
+        return assignments, np.flatnonzero(unmatched).tolist()
 
     def _update_tracks(
         self,
         assignments: Dict[int, int],
-        unmatched_detections: Set[int],
+        unmatched_detections: List[int],
         detection_boxes: List[Tuple[float, float, float, float]],
-        detections: Dict[Tuple[float, float, float, float], Dict[str, Any]],
+        detection_labels: List[Any],
     ) -> None:
         """
         Update existing tracks based on matched and unmatched detections.
@@ -223,19 +210,14 @@ class CardTracker(ICardTracker):
 
         Parameters:
             assignments (Dict[int, int]): A mapping of track IDs to their corresponding detection index.
-            unmatched_detections (Set[int]): A set of detection indices with no assignment.
+            unmatched_detections (List[int]): A list of detection indices with no assignment.
             detection_boxes (List[Tuple[...]]): A list of detection boxes.
-            detections (Dict[Tuple, Dict[str, Any]]): A mapping of bounding box coordinates to their detection
-            information.
+            detection_labels (List[Any]): The label of each detection, parallel to detection_boxes.
         """
         # Process tracks that have been assigned a detection
         for track_id, det_idx in assignments.items():
             track = self.tracks[track_id]
-            detection_bbox = detection_boxes[det_idx]
-            detection_info = detections.get(tuple(detection_bbox), {})
-            detection_label = detection_info.get("label", None)
-
-            track.register_hit(detection_bbox, detection_label)
+            track.register_hit(detection_boxes[det_idx], detection_labels[det_idx])
 
             if (
                 track.state == TrackState.TENTATIVE
@@ -246,21 +228,21 @@ class CardTracker(ICardTracker):
                 if self.on_confirm_callback:
                     self.on_confirm_callback(track)
 
-        # Process tracks that did not receive a matching detection in the current frame
-        for track_id in list(self.tracks.keys()):
-            if track_id not in assignments:
-                self.tracks[track_id].register_miss()
+        # Process tracks that did not receive a matching detection in the current frame; the key-view
+        # difference visits only those tracks and is a separate set, so deleting from the dict is safe
+        for track_id in self.tracks.keys() - assignments.keys():
+            track = self.tracks[track_id]
+            track.register_miss()
 
-                if self.tracks[track_id].misses > self.removal_frames:
-                    del self.tracks[track_id]
+            if track.misses > self.removal_frames:
+                del self.tracks[track_id]
 
         # Create new tracks for any detection that was not matched to an existing track
         for det_idx in unmatched_detections:
-            new_bbox = detection_boxes[det_idx]
-            detection_info = detections.get(tuple(new_bbox), {})
-            detection_label = detection_info.get("label", None)
             self.tracks[self.next_track_id] = Track(
-                track_id=self.next_track_id, bbox=new_bbox, label=detection_label
+                track_id=self.next_track_id,
+                bbox=detection_boxes[det_idx],
+                label=detection_labels[det_idx],
             )
             self.next_track_id += 1
 
@@ -270,8 +252,8 @@ class CardTracker(ICardTracker):
         """
         Update tracked cards using new detections.
 
-        This implementation converts detection bounding boxes into a list, performs data association and track
-        updates, and returns the assembled mapping.
+        This implementation unpacks the detections once into parallel box and label lists plus a float32 box
+        array, performs data association and track updates on those by index, and returns the assembled mapping.
 
         Parameters:
             detections (Dict[Tuple, Dict[str, Any]]): A mapping of bounding box coordinates to their detection
@@ -286,10 +268,13 @@ class CardTracker(ICardTracker):
                 - "label" (Any): The label associated with the detection that created or updated this track.
                 - "state" (int): The current track state.
         """
-        detection_boxes = [list(bbox) for bbox in detections.keys()]
-        assignments, unmatched_detections = self._data_association(detection_boxes)
+        detection_boxes = list(detections.keys())
+        detection_labels = [det_meta.get("label") for det_meta in detections.values()]
+        det_boxes = np.array(detection_boxes, dtype=np.float32).reshape(-1, 4)
+
+        assignments, unmatched_detections = self._data_association(det_boxes)
         self._update_tracks(
-            assignments, unmatched_detections, detection_boxes, detections
+            assignments, unmatched_detections, detection_boxes, detection_labels
         )
         # Return the current state of all tracks
         return {
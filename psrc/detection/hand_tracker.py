@@ -3,6 +3,10 @@ from typing import Any, Dict, List, Tuple
 import numpy as np
 
 from psrc.core.interfaces.i_hand_tracker import IHandTracker
+from psrc.detection.box_kernels import overlap_groups
+
+# Blackjack points of each card label (0 = ace, 9-12 = ten-value cards)
+CARD_POINTS: Tuple[int, ...] = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
 
 
 class HandTracker(IHandTracker):
@@ -28,8 +32,9 @@ class HandTracker(IHandTracker):
         """
         Score a hand based on blackjack rules.
 
-        This method counts aces as 1, with an option to add 10 if it does not bust the hand. Cards with values 1
-        through 8 are valued at card value + 1. Cards with value 9 and above are counted as 10.
+        This method sums card points looked up in CARD_POINTS, counting aces as 1, then adds 10 for a single
+        ace if that does not bust the hand. Cards with labels 1 through 8 are worth label + 1, and labels 9 and
+        above count as 10.
 
         Parameters:
             cards (List[int]): A list of card labels.
@@ -37,66 +42,16 @@ class HandTracker(IHandTracker):
         Returns:
             int: The best hand value less than or equal to 21.
         """
-        total = 0
-        aces = 0
-
-        # Iterate through each card in the hand and update total and ace count accordingly
-        for card in cards:
-            if card == 0:
-                total += 1
-                aces += 1
-            elif 1 <= card <= 8:
-                total += card + 1
-            else:
-                total += 10
-
-        # If possible, adjust Aces by adding 10 without busting
-        while aces > 0 and total + 10 <= 21:
-            total += 10
-            aces -= 1
-
-        return int(total)
-
-    def _compute_overlap_matrix(self, boxes: np.ndarray) -> np.ndarray:
-        """
-        Compute overlap ratios between all pairs of boxes.
-
-        This method calculates intersection area over the smaller box’s area for each pair.
+        # Look up each card's points, with aces scoring 1 until adjusted below
+        total = sum(
+            CARD_POINTS[card] if 0 <= card < len(CARD_POINTS) else 10 for card in cards
+        )
 
-        Parameters:
-            boxes (np.ndarray): An array of bounding boxes of shape (N, 4), with each box as [x_min, y_min,
-            x_max, y_max].
+        # Two aces at 11 would always bust, so at most one ace is ever raised by 10
+        if total + 10 <= 21 and 0 in cards:
+            total += 10
 
-        Returns:
-            np.ndarray: A (N, N) matrix where each element represents the overlap ratio between two boxes.
-        """
-        # Extract the coordinates for each bounding box
-        x_min = boxes[:, 0]
-        y_min = boxes[:, 1]
-        x_max = boxes[:, 2]
-        y_max = boxes[:, 3]
-
-        # For each pair, determine the coordinates of the intersection rectangle
-        x_left = np.maximum(x_min[:, None], x_min[None, :])
-        y_top = np.maximum(y_min[:, None], y_min[None, :])
-        x_right = np.minimum(x_max[:, None], x_max[None, :])
-        y_bottom = np.minimum(y_max[:, None], y_max[None, :])
-
-        # Compute intersection dimensions, ensuring no negative values
-        inter_width = np.maximum(0, x_right - x_left)
-        inter_height = np.maximum(0, y_bottom - y_top)
-        inter_area = inter_width * inter_height
-
-        area = (x_max - x_min) * (y_max - y_min)  # Calculate area for each bounding box
-        min_area = np.minimum(
-            area[:, None], area[None, :]
-        )  # For each pair, use the smaller area for the overlap ratio
-
-        overlap = inter_area / (
-            min_area + 1e-6
-        )  # Calculate the overlap ratio for each pair (with epsilon to avoid division by zero)
-
-        return overlap
+        return total
 
     def _group_cards(
         self, boxes: List[Tuple[float, float, float, float]]
@@ -104,8 +59,8 @@ class HandTracker(IHandTracker):
         """
         Group boxes into clusters where overlap is greater than or equal to the overlap threshold.
 
-        This method builds an adjacency matrix from overlap ratios and uses union-find to cluster connected
-        indices into hands.
+        This method uses a compiled union-find kernel over the pairwise overlap ratios (intersection area over
+        the smaller box's area) to cluster connected indices into hands.
 
         Parameters:
             boxes (List[Tuple[float, float, float, float]]): A list of bounding boxes.
@@ -119,46 +74,14 @@ class HandTracker(IHandTracker):
         if n == 0:
             return []
 
-        boxes_np = np.array(boxes).reshape(
-            -1, 4
-        )  # Convert list of boxes to a NumPy array for efficient computation
-        overlap_matrix = self._compute_overlap_matrix(
-            boxes_np
-        )  # Compute the pairwise overlap matrix between bounding boxes
-
-        # Create an adjacency matrix where it is True if overlap is above the threshold
-        adj = overlap_matrix >= self.overlap_threshold
-        np.fill_diagonal(adj, False)
-
-        parent = list(range(n))
-
-        # Find the representative of the set containing x using path compression
-        def _find(x: int) -> int:
-            while parent[x] != x:
-                parent[x] = parent[parent[x]]
-                x = parent[x]
-            return x
-
-        # Merge the sets containing x and y
-        def _union(x: int, y: int) -> None:
-            root_x = _find(x)
-            root_y = _find(y)
-
-            if root_x != root_y:
-                parent[root_y] = root_x
-
-        # Iterate over all pairs of boxes and union their sets if they are adjacent
-        for i in range(n):
-            for j in range(i + 1, n):
-                if adj[i, j]:
-                    _union(i, j)
+        # Cluster overlapping boxes with the compiled union-find kernel, which runs without holding the GIL
+        boxes_np = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        roots = overlap_groups(boxes_np, self.overlap_threshold).tolist()
 
         # Group boxes based on their representative parent
         groups_dict: Dict[int, List[int]] = {}
 
-        for i in range(n):
-            root = _find(i)
-
+        for i, root in enumerate(roots):
             if root not in groups_dict:
                 groups_dict[root] = []
 
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from threading import Lock
 
 import cv2
+import numpy as np
 from rich.console import Console, Group
 from rich.live import Live
 from rich.table import Table
@@ -68,6 +69,9 @@ class HybridDisplay(IDisplay):
         self.window_name = window_name
         self.w, self.h = window_frame_size
 
+        # Window-size resize destination, reused for every shown frame since imshow copies its input
+        self._window_buffer = np.empty((self.h, self.w, 3), dtype=np.uint8)
+
         cv2.namedWindow(self.window_name, cv2.WINDOW_AUTOSIZE)
         cv2.resizeWindow(self.window_name, self.w, self.h)
 
@@ -78,6 +82,7 @@ class HybridDisplay(IDisplay):
         self._hands: Dict[str, Any] = {}
         self._evals: Dict[str, Any] = {}
         self._deck: Dict[int, int] = {}
+        self._table_version = 0
 
         self.console = Console()
 
@@ -95,7 +100,9 @@ class HybridDisplay(IDisplay):
         Update any subset of the display state.
 
         This implementation acquires a lock and updates any provided subset of frame, detections, tracks,
-        hands, evals, and deck.
+        hands, evals, and deck. The frame is stored by reference rather than copied, since the engine hands
+        over a freshly annotated frame each time. Table state is only copied when it differs from what is held,
+        and each such change bumps a version so the display loop rebuilds its tables only when needed.
 
         Parameters:
             frame (Any, optional): The frame for display.
@@ -108,17 +115,20 @@ class HybridDisplay(IDisplay):
         """
         with self._lock:
             if frame is not None:
-                self._frame = frame.copy()
+                self._frame = frame
             if detections is not None:
                 self._detections = detections.copy()
             if tracks is not None:
                 self._tracks = tracks.copy()
-            if hands is not None:
+            if hands is not None and hands != self._hands:
                 self._hands = hands.copy()
-            if evals is not None:
+                self._table_version += 1
+            if evals is not None and evals != self._evals:
                 self._evals = evals.copy()
-            if deck is not None:
+                self._table_version += 1
+            if deck is not None and deck != self._deck:
                 self._deck = deck.copy()
+                self._table_version += 1
 
     def process_events(self) -> bool:
         """
@@ -174,7 +184,7 @@ class HybridDisplay(IDisplay):
                 display_id = f"Player {hid}"
 
             cards = [
-                self.RANKS[int(card)] if 0 <= int(card) < len(self.RANKS) else str(card)
+                self.RANKS[card] if 0 <= card < len(self.RANKS) else str(card)
                 for card in info.get("cards", [])
             ]
             display_cards = ", ".join(cards)
@@ -185,6 +195,21 @@ class HybridDisplay(IDisplay):
 
         return tbl
 
+    @staticmethod
+    def _format_ev(ev: float) -> str:
+        """
+        Format an expected value as Rich markup, green when non-negative and red otherwise.
+
+        Parameters:
+            ev (float): The expected value.
+
+        Returns:
+            str: The colored, two-decimal markup string.
+        """
+        if ev >= 0:
+            return f"[green]{ev:.2f}[/green]"
+        return f"[red]{ev:.2f}[/red]"
+
     def _make_ev_table(self) -> Table:
         """
         Create the expected-value table for Rich display.
@@ -193,24 +218,19 @@ class HybridDisplay(IDisplay):
             Table: A Rich Table with one row per hand, containing EV columns and best action.
         """
         tbl = self._build_table("EXPECTED VALUE INFORMATION", self.EV_COLUMNS)
+        fmt = self._format_ev
 
         for hid, res in self._evals.items():
-            display_id = f"Player {hid}"
             evs = res.get("evs", {})
             best = res.get("best_action", "")
 
-            def fmt(key: str) -> str:
-                v = evs.get(key, 0.0)
-                col = "green" if v >= 0 else "red"
-                return f"[{col}]{v:.2f}[/{col}]"
-
             tbl.add_row(
-                display_id,
-                fmt("stand"),
-                fmt("hit"),
-                fmt("double"),
-                fmt("split"),
-                fmt("surrender"),
+                f"Player {hid}",
+                fmt(evs.get("stand", 0.0)),
+                fmt(evs.get("hit", 0.0)),
+                fmt(evs.get("double", 0.0)),
+                fmt(evs.get("split", 0.0)),
+                fmt(evs.get("surrender", 0.0)),
                 f"[bold yellow]{best}[/bold yellow]",
             )
 
@@ -235,34 +255,53 @@ class HybridDisplay(IDisplay):
         """
         Run the live display loop until the window closes.
 
-        This method opens a Rich Live context, resizes and shows frames when updated, updates Rich tables
-        whenever state is updated.
+        This method opens a Rich Live context, resizes (when needed) and shows each new frame once, and rebuilds
+        the Rich tables only when the table version has moved since the last build.
 
         Returns:
             None
         """
-        prev_hands, prev_evals, prev_deck = None, None, None
+        shown_version = -1
+        shown_frame = None
 
         with Live(console=self.console, screen=False, auto_refresh=True) as live:
             while True:
                 with self._lock:
                     frame = self._frame
-                    hands = self._hands.copy()
-                    evs = self._evals.copy()
-                    deck = self._deck.copy()
+                    version = self._table_version
+
+                # Only resize and show frames that have not been shown yet, skipping the resize at window size
+                if frame is not None and frame is not shown_frame:
+                    h, w = frame.shape[:2]
+
+                    if w == self.w and h == self.h:
+                        display_frame = frame
+                    else:
+                        # Area averaging is sharper and just as fast on an exact 2x shrink only
+                        halving = self.w * 2 == w and self.h * 2 == h
+                        display_frame = cv2.resize(
+                            frame,
+                            (self.w, self.h),
+                            dst=self._window_buffer,
+                            interpolation=(
+                                cv2.INTER_AREA if halving else cv2.INTER_LINEAR
+                            ),
+                        )
 
-                if frame is not None:
-                    display_frame = cv2.resize(frame, (self.w, self.h))
                     cv2.imshow(self.window_name, display_frame)
+                    shown_frame = frame
 
                 if not self.process_events():
                     break
 
-                if (hands, evs, deck) != (prev_hands, prev_evals, prev_deck):
-                    tbls = Group(
-                        self._make_hand_table(),
-                        self._make_ev_table(),
-                        self._make_deck_table(),
-                    )
+                if version != shown_version:
+                    # Build under the lock so the tables see one consistent snapshot of the state
+                    with self._lock:
+                        tbls = Group(
+                            self._make_hand_table(),
+                            self._make_ev_table(),
+                            self._make_deck_table(),
+                        )
+                        shown_version = self._table_version
+
                     live.update(tbls)
-                    prev_hands, prev_evals, prev_deck = hands, evs, deck
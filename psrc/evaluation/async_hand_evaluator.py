@@ -0,0 +1,114 @@
+from typing import Any, Dict, Optional
+
+import threading
+
+from psrc.core.interfaces.i_hand_evaluator import IHandEvaluator
+from psrc.debugging.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AsyncHandEvaluator(IHandEvaluator):
+    """
+    AsyncHandEvaluator is an implementation of the IHandEvaluator interface.
+
+    This implementation wraps another hand evaluator and runs it on a background worker thread, so the caller
+    never waits on an EV computation. Each call hands the latest hands to the worker, replacing any hands it
+    has not started on yet, and immediately returns the most recent completed results, which may lag the hands
+    by one evaluation. The Numba kernels and JPype calls release the GIL while they compute, so detection and
+    tracking keep running alongside the evaluation.
+    """
+
+    def __init__(self, evaluator: IHandEvaluator) -> None:
+        """
+        Initialize AsyncHandEvaluator and start its worker thread.
+
+        Parameters:
+            evaluator (IHandEvaluator): The evaluator run on the worker thread.
+        """
+        self.evaluator = evaluator
+
+        # Hands waiting for the worker, the last hands handed over, and the latest completed results
+        self._condition = threading.Condition()
+        self._pending: Optional[Dict[str, Dict[str, Any]]] = None
+        self._submitted: Optional[Dict[str, Dict[str, Any]]] = None
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._error: Optional[Exception] = None
+        self._stopped = False
+
+        self._worker = threading.Thread(target=self._work_loop, daemon=True)
+        self._worker.start()
+
+    def _work_loop(self) -> None:
+        """
+        Evaluate the newest pending hands until released, publishing each result and stopping at the first
+        failure.
+
+        Returns:
+            None
+        """
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopped:
+                    self._condition.wait()
+
+                if self._stopped:
+                    return
+
+                hands, self._pending = self._pending, None
+
+            try:
+                results = self.evaluator.evaluate_hands(hands)
+            except Exception as e:
+                logger.exception("Hand evaluation failed")
+
+                with self._condition:
+                    self._error = e
+                return
+
+            with self._condition:
+                self._results = results
+
+    def evaluate_hands(
+        self, hands: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluate each player's hand and select the optimal action.
+
+        This implementation queues the hands for the worker thread unless they are the same object as the last
+        hands queued, then returns the latest completed results without waiting.
+
+        Parameters:
+            hands (Dict[str, Dict[str, Any]]): A mapping of hand IDs to their hand information.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: A mapping of hand IDs to their evaluation information, from the most
+            recent completed evaluation (empty until the first one completes).
+
+        Raises:
+            RuntimeError: If the worker thread failed to evaluate a previous set of hands.
+        """
+        with self._condition:
+            if self._error is not None:
+                raise RuntimeError("Hand evaluation failed") from self._error
+
+            if hands is not self._submitted:
+                self._pending = hands
+                self._submitted = hands
+                self._condition.notify()
+
+            return self._results
+
+    def release(self) -> None:
+        """
+        Release evaluator resources.
+
+        This implementation stops the worker thread, waiting for any evaluation in progress to finish, then
+        releases the wrapped evaluator.
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+        self._worker.join()
+        self.evaluator.release()
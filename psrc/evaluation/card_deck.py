@@ -1,4 +1,6 @@
-from typing import Dict
+from typing import Dict, Optional
+
+import numpy as np
 
 from psrc.core.interfaces.i_card_deck import ICardDeck
 
@@ -8,7 +10,10 @@ class CardDeck(ICardDeck):
     CardDeck is an implementation of the ICardDeck interface.
 
     This implementation initializes a combined multi-deck count, and provides methods to add or remove a card by
-    normalizing face cards to label 9 and updating the internal counts accordingly.
+    normalizing face cards to label 9 and updating the internal counts accordingly. Counts are held in a
+    fixed-size int64 array indexed by label, which EV calculators consume directly; the dict view used for
+    display is built lazily, once per deck version. Every successful change bumps a version counter, so
+    consumers can detect deck changes without comparing counts.
     """
 
     def __init__(self, deck_count: int) -> None:
@@ -20,8 +25,48 @@ class CardDeck(ICardDeck):
         Parameters:
             deck_count (int): The number of decks to combine.
         """
-        self.cards: Dict[int, int] = {i: 4 * deck_count for i in range(0, 9)}
-        self.cards[9] = 16 * deck_count
+        self._counts = np.full(10, 4 * deck_count, dtype=np.int64)
+        self._counts[9] = 16 * deck_count
+        self._version = 0
+
+        # Dict view of the counts and the version it was built for
+        self._cards: Dict[int, int] = {}
+        self._cards_version: Optional[int] = None
+
+    @property
+    def counts(self) -> np.ndarray:
+        """
+        Get the remaining count of each card label.
+
+        Returns:
+            np.ndarray: The int64 counts indexed by label 0-9 (shape: [10]). The array is owned by the deck and
+            must not be modified.
+        """
+        return self._counts
+
+    @property
+    def cards(self) -> Dict[int, int]:
+        """
+        Get the remaining count of each card label as a dict, rebuilt only after the deck has changed.
+
+        Returns:
+            Dict[int, int]: A mapping of card label to count.
+        """
+        if self._cards_version != self._version:
+            self._cards = dict(enumerate(self._counts.tolist()))
+            self._cards_version = self._version
+
+        return self._cards
+
+    @property
+    def version(self) -> int:
+        """
+        Get the deck version, which increases every time a card is added or removed.
+
+        Returns:
+            int: The current deck version.
+        """
+        return self._version
 
     def add_card(self, card_label: int) -> bool:
         """
@@ -38,8 +83,9 @@ class CardDeck(ICardDeck):
         """
         normalized_label = 9 if card_label in {9, 10, 11, 12} else card_label
 
-        if normalized_label in self.cards:
-            self.cards[normalized_label] += 1
+        if 0 <= normalized_label < 10:
+            self._counts[normalized_label] += 1
+            self._version += 1
             return True
         else:
             return False
@@ -59,8 +105,9 @@ class CardDeck(ICardDeck):
         """
         normalized_label = 9 if card_label in {9, 10, 11, 12} else card_label
 
-        if normalized_label in self.cards and self.cards[normalized_label] > 0:
-            self.cards[normalized_label] -= 1
+        if 0 <= normalized_label < 10 and self._counts[normalized_label] > 0:
+            self._counts[normalized_label] -= 1
+            self._version += 1
             return True
         else:
             return False
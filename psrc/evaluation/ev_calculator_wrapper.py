@@ -1,22 +1,41 @@
-from typing import Any, Dict, List
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import jpype
+import numpy as np
 
 from psrc.core.interfaces.i_ev_calculator import IExpectedValueCalculator
 
+# Blackjack value of each card label (0 = ace, 9 = ten-value); float labels hash equal to their int keys
+CARD_VALUES: Dict[int, int] = {label: label + 1 for label in range(9)}
+CARD_VALUES[9] = 10
+
 
 class EVCalculatorWrapper(IExpectedValueCalculator):
     """
     EVCalculatorWrapper is an implementation of the IExpectedValueCalculator interface.
 
     This implementation starts a JVM, wraps a Java EVCalculator class, and forwards expected-value computation
-    calls by converting Python data structures into Java arrays/lists.
+    calls by converting Python data structures into Java arrays/lists. Results are memoized in a bounded LRU
+    cache keyed by the canonical deck composition and hands, so repeat evaluations skip the JVM round trip.
+
+    Attributes:
+        BATCH_ACTIONS (Tuple[Tuple[str, str], ...]): The action names and matching Java methods, in the column
+        order returned by the Java calculateAllEVs batch call.
     """
 
+    BATCH_ACTIONS: Tuple[Tuple[str, str], ...] = (
+        ("stand", "calculateStandEV"),
+        ("hit", "calculateHitEV"),
+        ("double", "calculateDoubleEV"),
+        ("split", "calculateSplitEV"),
+    )
+
     def __init__(
         self,
         jar_path: str = "target/blackjack-ev-calculator-1.0.0.jar",
         class_path: str = "evaluation.EVCalculator",
+        cache_size: int = 100_000,
     ) -> None:
         """
         Initialize EVCalculatorWrapper by launching the JVM and instantiating the Java calculator.
@@ -24,9 +43,14 @@ class EVCalculatorWrapper(IExpectedValueCalculator):
         Parameters:
             jar_path (str): The path to the EV calculator JAR.
             class_path (str): The fully qualified Java class name.
+            cache_size (int): The maximum number of memoized expected values.
         """
         self.jar_path = jar_path
         self.class_path = class_path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple, float]" = OrderedDict()
+        # Deck composition the Java-side memo was built for
+        self._java_deck_key: Optional[Tuple[int, ...]] = None
         # Start the JVM and initialize the Java EV calculator
         self._start_jvm()
 
@@ -45,170 +69,323 @@ class EVCalculatorWrapper(IExpectedValueCalculator):
         self._java_ev_cls = jpype.JClass(self.class_path)
         self._java_ev = self._java_ev_cls()
 
-    def _deck_to_java_array(self, deck: Dict[int, int]) -> Any:
+        # Resolve the Java classes used for marshalling once rather than on every conversion
+        self._java_int_array_cls = jpype.JArray(jpype.JInt)
+        self._java_array_list_cls = jpype.JClass("java.util.ArrayList")
+
+    def _deck_key(self, deck: Sequence[int]) -> Tuple[int, ...]:
         """
-        Convert a Python deck dictionary to a Java array of integers.
+        Convert a deck count vector to a canonical tuple of counts.
 
-        This method orders card counts from label 0 through 9, constructs a Python list of those counts, and uses
-        JPype’s JArray and JInt to build a Java integer array.
+        This method converts the counts of labels 0 through 9 to a tuple of Python ints in one call, which makes
+        the deck composition hashable for use in the result cache.
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
 
         Returns:
-            Any: A Java integer array containing counts in label order.
+            Tuple[int, ...]: The card counts in label order.
         """
-        order = list(range(0, 10))
-        deck_values = [deck.get(i, 0) for i in order]
-        # Convert the Python list to a Java integer array using JArray and JInt
-        return jpype.JArray(jpype.JInt)([jpype.JInt(val) for val in deck_values])
+        return tuple(np.asarray(deck).tolist())
 
-    def _hand_to_java_array_list(self, hand: List[int]) -> Any:
+    def _hand_key(self, hand: List[int]) -> Tuple[int, ...]:
         """
-        Convert a Python hand list to a Java ArrayList of integers.
+        Convert a Python hand list to a canonical tuple of blackjack values.
 
-        This method normalizes each card label to its blackjack value, wraps each in JInt, and adds to a Java
-        ArrayList.
+        This method normalizes each card label to its blackjack value through the CARD_VALUES lookup table and
+        sorts the values, since the expected value of a hand does not depend on the order its cards were dealt.
 
         Parameters:
             hand (List[int]): A list of card labels in the hand.
 
         Returns:
-            Any: A Java integer ArrayList containing normalized card values.
+            Tuple[int, ...]: The sorted normalized card values.
         """
-        # Get the Java ArrayList class and create an instance
-        ArrayList = jpype.JClass("java.util.ArrayList")
-        java_list = ArrayList()
+        return tuple(sorted(CARD_VALUES.get(card, 10) for card in hand))
 
-        # Iterate through each card in the hand and normalize its value
-        for card in hand:
-            if card == 0:
-                value = 1
-            elif 1 <= card <= 8:
-                value = card + 1
-            else:
-                value = 10
+    def _deck_to_java_array(self, deck_key: Tuple[int, ...]) -> Any:
+        """
+        Convert a canonical deck tuple to a Java array of integers.
+
+        This method packs the counts into an int32 NumPy array, which JPype copies into a Java int[] in a
+        single bulk transfer through the buffer protocol instead of converting each element.
 
-            # Add the normalized value to the Java ArrayList as a JInt
+        Parameters:
+            deck_key (Tuple[int, ...]): The card counts in label order.
+
+        Returns:
+            Any: A Java integer array containing counts in label order.
+        """
+        return self._java_int_array_cls(np.asarray(deck_key, dtype=np.int32))
+
+    def _hand_to_java_array_list(self, hand_key: Tuple[int, ...]) -> Any:
+        """
+        Convert a canonical hand tuple to a Java ArrayList of integers.
+
+        This method wraps each normalized card value in JInt and adds it to a Java ArrayList.
+
+        Parameters:
+            hand_key (Tuple[int, ...]): The normalized card values in the hand.
+
+        Returns:
+            Any: A Java integer ArrayList containing normalized card values.
+        """
+        java_list = self._java_array_list_cls()
+
+        for value in hand_key:
             java_list.add(jpype.JInt(value))
 
         return java_list
 
+    def _sync_java_deck(self, deck_key: Tuple[int, ...]) -> None:
+        """
+        Clear the Java calculator's memo when the deck composition differs from the one it was built for.
+
+        Java memo entries are keyed by the full deck, so after a card leaves the deck they are almost never
+        reused; clearing them keeps the JVM heap from growing over a session.
+
+        Parameters:
+            deck_key (Tuple[int, ...]): The card counts in label order for the upcoming Java call.
+        """
+        if deck_key != self._java_deck_key:
+            self._java_ev.clearCache()
+            self._java_deck_key = deck_key
+
+    def _store_cached(self, key: Tuple, value: float) -> None:
+        """
+        Store a value in the result cache, evicting the least recently used entry once the cache is full.
+
+        Parameters:
+            key (Tuple): The canonical cache key.
+            value (float): The expected value to store.
+        """
+        self._cache[key] = value
+
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _calculate_cached(
+        self,
+        java_method: str,
+        deck: Sequence[int],
+        player_hand: List[int],
+        dealer_hand: List[int],
+    ) -> float:
+        """
+        Calculate an expected value through the result cache.
+
+        This method builds a canonical key from the Java method name, deck composition, and both hands. On a
+        hit the cached value is returned without crossing into the JVM; on a miss the Java memo is cleared if
+        the deck has changed since the last Java call, then the Java method is called and its result stored,
+        evicting the least recently used entry once the cache is full.
+
+        Parameters:
+            java_method (str): The name of the Java EVCalculator method to call.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
+            player_hand (List[int]): A list of card labels in the player's hand.
+            dealer_hand (List[int]): A list of card labels in the dealer's hand.
+
+        Returns:
+            float: The expected value returned by the Java method.
+        """
+        deck_key = self._deck_key(deck)
+        player_key = self._hand_key(player_hand)
+        dealer_key = self._hand_key(dealer_hand)
+        key = (java_method, deck_key, player_key, dealer_key)
+
+        cached = self._cache.get(key)
+
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        self._sync_java_deck(deck_key)
+
+        value = float(
+            getattr(self._java_ev, java_method)(
+                self._deck_to_java_array(deck_key),
+                self._hand_to_java_array_list(player_key),
+                self._hand_to_java_array_list(dealer_key),
+            )
+        )
+
+        self._store_cached(key, value)
+
+        return value
+
     def calculate_stand_ev(
         self,
-        deck: Dict[int, int],
+        deck: Sequence[int],
         player_hand: List[int],
         dealer_hand: List[int],
     ) -> float:
         """
         Calculate the expected value when the player stands.
 
-        This implementation converts the deck and hands to Java arrays/lists and calls the Java method
-        calculateStandEV.
+        This implementation returns a cached value when available, otherwise converts the deck and hands to
+        Java arrays/lists and calls the Java method calculateStandEV.
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
             player_hand (List[int]): A list of card labels in the player's hand.
             dealer_hand (List[int]): A list of card labels in the dealer's hand.
 
         Returns:
             float: The expected value for the stand decision.
         """
-        return float(
-            self._java_ev.calculateStandEV(
-                self._deck_to_java_array(deck),
-                self._hand_to_java_array_list(player_hand),
-                self._hand_to_java_array_list(dealer_hand),
-            )
+        return self._calculate_cached(
+            "calculateStandEV", deck, player_hand, dealer_hand
         )
 
     def calculate_hit_ev(
         self,
-        deck: Dict[int, int],
+        deck: Sequence[int],
         player_hand: List[int],
         dealer_hand: List[int],
     ) -> float:
         """
         Calculate the expected value when the player hits.
 
-        This implementation converts the deck and hands to Java arrays/lists and calls the Java method
-        calculateHitEV.
+        This implementation returns a cached value when available, otherwise converts the deck and hands to
+        Java arrays/lists and calls the Java method calculateHitEV.
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
             player_hand (List[int]): A list of card labels in the player's hand.
             dealer_hand (List[int]): A list of card labels in the dealer's hand.
 
         Returns:
             float: The expected value for the hit decision.
         """
-        return float(
-            self._java_ev.calculateHitEV(
-                self._deck_to_java_array(deck),
-                self._hand_to_java_array_list(player_hand),
-                self._hand_to_java_array_list(dealer_hand),
-            )
-        )
+        return self._calculate_cached("calculateHitEV", deck, player_hand, dealer_hand)
 
     def calculate_double_ev(
         self,
-        deck: Dict[int, int],
+        deck: Sequence[int],
         player_hand: List[int],
         dealer_hand: List[int],
     ) -> float:
         """
         Calculate the expected value when the player doubles.
 
-        This implementation converts the deck and hands to Java arrays/lists and calls the Java method
-        calculateDoubleEV.
+        This implementation returns a cached value when available, otherwise converts the deck and hands to
+        Java arrays/lists and calls the Java method calculateDoubleEV.
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
             player_hand (List[int]): A list of card labels in the player's hand.
             dealer_hand (List[int]): A list of card labels in the dealer's hand.
 
         Returns:
             float: The expected value for the double decision.
         """
-        return float(
-            self._java_ev.calculateDoubleEV(
-                self._deck_to_java_array(deck),
-                self._hand_to_java_array_list(player_hand),
-                self._hand_to_java_array_list(dealer_hand),
-            )
+        return self._calculate_cached(
+            "calculateDoubleEV", deck, player_hand, dealer_hand
         )
 
     def calculate_split_ev(
         self,
-        deck: Dict[int, int],
+        deck: Sequence[int],
         player_hand: List[int],
         dealer_hand: List[int],
     ) -> float:
         """
         Calculate the expected value when the player splits.
 
-        This implementation converts the deck and hands to Java arrays/lists and calls the Java method
-        calculateSplitEV.
+        This implementation returns a cached value when available, otherwise converts the deck and hands to
+        Java arrays/lists and calls the Java method calculateSplitEV.
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
             player_hand (List[int]): A list of card labels in the player's hand.
             dealer_hand (List[int]): A list of card labels in the dealer's hand.
 
         Returns:
             float: The expected value for the split decision.
         """
-        return float(
-            self._java_ev.calculateSplitEV(
-                self._deck_to_java_array(deck),
-                self._hand_to_java_array_list(player_hand),
-                self._hand_to_java_array_list(dealer_hand),
-            )
+        return self._calculate_cached(
+            "calculateSplitEV", deck, player_hand, dealer_hand
         )
 
+    def calculate_all_evs(
+        self,
+        deck: Sequence[int],
+        player_hands: List[List[int]],
+        dealer_hand: List[int],
+    ) -> List[Dict[str, float]]:
+        """
+        Calculate the expected values of every action for several player hands against one dealer hand.
+
+        This implementation looks up each hand's stand, hit, double, and split values in the result cache,
+        sends every hand with a missing value to the Java method calculateAllEVs in a single JVM call (clearing
+        the Java memo first if the deck has changed), and stores the returned values. Surrender is always -0.5.
+
+        Parameters:
+            deck (Sequence[int]): The remaining count of each card label 0-9.
+            player_hands (List[List[int]]): A list of player hands, each a list of card labels.
+            dealer_hand (List[int]): A list of card labels in the dealer's hand.
+
+        Returns:
+            List[Dict[str, float]]: One dict per player hand, in input order, mapping "stand", "hit", "double",
+            "split", and "surrender" to their expected values.
+        """
+        deck_key = self._deck_key(deck)
+        dealer_key = self._hand_key(dealer_hand)
+        player_keys = [self._hand_key(hand) for hand in player_hands]
+
+        # Resolve each distinct hand from the cache, collecting those with any action missing
+        hand_evs: Dict[Tuple[int, ...], Dict[str, float]] = {}
+        missing: List[Tuple[int, ...]] = []
+
+        for player_key in dict.fromkeys(player_keys):
+            evs: Dict[str, float] = {}
+
+            for action, java_method in self.BATCH_ACTIONS:
+                key = (java_method, deck_key, player_key, dealer_key)
+                cached = self._cache.get(key)
+
+                if cached is None:
+                    missing.append(player_key)
+                    break
+
+                self._cache.move_to_end(key)
+                evs[action] = cached
+            else:
+                evs["surrender"] = -0.5
+                hand_evs[player_key] = evs
+
+        if missing:
+            self._sync_java_deck(deck_key)
+
+            java_hands = self._java_array_list_cls()
+
+            for player_key in missing:
+                java_hands.add(self._hand_to_java_array_list(player_key))
+
+            rows = self._java_ev.calculateAllEVs(
+                self._deck_to_java_array(deck_key),
+                java_hands,
+                self._hand_to_java_array_list(dealer_key),
+            )
+
+            for player_key, row in zip(missing, rows):
+                evs = {}
+
+                for (action, java_method), value in zip(self.BATCH_ACTIONS, row):
+                    evs[action] = float(value)
+                    self._store_cached(
+                        (java_method, deck_key, player_key, dealer_key), evs[action]
+                    )
+
+                evs["surrender"] = -0.5
+                hand_evs[player_key] = evs
+
+        # Give each hand its own dict so callers can mutate results independently
+        return [dict(hand_evs[player_key]) for player_key in player_keys]
+
     def calculate_surrender_ev(
         self,
-        deck: Dict[int, int],
+        deck: Sequence[int],
         player_hand: List[int],
         dealer_hand: List[int],
     ) -> float:
@@ -218,7 +395,7 @@ class EVCalculatorWrapper(IExpectedValueCalculator):
         This implementation returns a fixed value of -0.5 (no Java call).
 
         Parameters:
-            deck (Dict[int, int]): A mapping of card labels to remaining counts.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
             player_hand (List[int]): A list of card labels in the player's hand.
             dealer_hand (List[int]): A list of card labels in the dealer's hand.
 
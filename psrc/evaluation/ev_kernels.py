@@ -0,0 +1,608 @@
+import numpy as np
+from numba import njit, prange, types
+from numba.typed import Dict
+
+# Memo key: the packed deck, and the packed player and dealer hand states with the split flag and action
+_KEY_TYPE = types.UniTuple(types.int64, 2)
+
+# Largest count the packed deck can hold for labels 0-8 (6 bits) and for the ten-value label (8 bits)
+MAX_LABEL_COUNT = 63
+MAX_TEN_COUNT = 255
+_MEMO_TYPE = types.DictType(_KEY_TYPE, types.float64)
+
+# Bit offset and mask of each label's count within the packed deck, with the ace in the highest bits
+_DECK_SHIFTS = np.array([8 + 6 * (8 - i) for i in range(9)] + [0], dtype=np.int64)
+_DECK_MASKS = np.array([MAX_LABEL_COUNT] * 9 + [MAX_TEN_COUNT], dtype=np.int64)
+
+# Explicit signatures give each recursive kernel exactly one compiled (and cached) specialization
+_I64 = types.int64
+_COUNTS = types.int64[::1]
+_RULES = types.float64[::1]
+_STATE_SIG = types.float64(
+    _I64, _I64, _I64, _I64, _I64, _I64, _I64, _I64, _RULES, _MEMO_TYPE
+)
+
+# Action indices shared with the calculator
+STAND, HIT, DOUBLE, SPLIT = 0, 1, 2, 3
+
+# Positions of each rule in the rules array
+BLACKJACK_ODDS = 0
+DEALER_HITS_ON_SOFT_17 = 1
+DEALER_PEAKS_FOR_21 = 2
+NATURAL_BLACKJACK_SPLITS = 3
+DOUBLE_AFTER_SPLIT = 4
+HIT_SPLIT_ACES = 5
+DOUBLE_SPLIT_ACES = 6
+
+
+@njit(_I64(_I64), cache=True)
+def _card_value(label: int) -> int:
+    """
+    Get the blackjack value of a card label (0 = ace, 9-12 = ten-value).
+
+    Parameters:
+        label (int): The card label.
+
+    Returns:
+        int: The card value, counting aces as 1.
+    """
+    return label + 1 if label < 9 else 10
+
+
+@njit(_I64(_I64, _I64), cache=True)
+def _score(hard: int, ace: int) -> int:
+    """
+    Get the score of a hand, counting one ace as 11 when that does not bust.
+
+    Parameters:
+        hard (int): The hand total with every ace counted as 1.
+        ace (int): 1 if the hand holds an ace, 0 otherwise.
+
+    Returns:
+        int: The hand score.
+    """
+    if ace and hard + 10 <= 21:
+        return hard + 10
+    return hard
+
+
+@njit(_I64(_COUNTS), cache=True)
+def _pack_deck(counts: np.ndarray) -> int:
+    """
+    Pack the card counts into one integer, 6 bits per label and 8 bits for the ten-value label.
+
+    Parameters:
+        counts (np.ndarray): The int64 remaining count of each card label 0-9, each within its field.
+
+    Returns:
+        int: The packed deck.
+    """
+    deck = 0
+
+    for i in range(10):
+        deck |= counts[i] << _DECK_SHIFTS[i]
+
+    return deck
+
+
+@njit(_I64(_I64, _I64), cache=True)
+def _count(deck: int, label: int) -> int:
+    """
+    Get the remaining count of a card label from a packed deck.
+
+    Parameters:
+        deck (int): The packed deck.
+        label (int): The card label 0-9.
+
+    Returns:
+        int: The remaining count of the label.
+    """
+    return (deck >> _DECK_SHIFTS[label]) & _DECK_MASKS[label]
+
+
+@njit(_I64(_I64), cache=True)
+def _draw(label: int) -> int:
+    """
+    Get the amount to subtract from a packed deck to draw one card of a label.
+
+    Parameters:
+        label (int): The card label 0-9.
+
+    Returns:
+        int: The packed single card.
+    """
+    return 1 << _DECK_SHIFTS[label]
+
+
+@njit(_KEY_TYPE(_I64, _I64, _I64, _I64, _I64, _I64, _I64, _I64, _I64), cache=True)
+def _key(
+    deck: int,
+    p_hard: int,
+    p_ace: int,
+    p_n: int,
+    d_hard: int,
+    d_ace: int,
+    d_n: int,
+    is_split: int,
+    action: int,
+) -> tuple:
+    """
+    Build the memo key of a game state as two packed integers.
+
+    The first is the packed deck itself, the second packs the hand totals, ace flags, hand sizes, split flag,
+    and action. Hand sizes are capped at 3, since past two cards the size no longer affects any outcome.
+
+    Returns:
+        tuple: The packed deck and hand state.
+    """
+    state_code = p_hard
+    state_code = (state_code << 1) | p_ace
+    state_code = (state_code << 2) | min(p_n, 3)
+    state_code = (state_code << 6) | d_hard
+    state_code = (state_code << 1) | d_ace
+    state_code = (state_code << 2) | min(d_n, 3)
+    state_code = (state_code << 1) | is_split
+    state_code = (state_code << 2) | action
+
+    return (deck, state_code)
+
+
+@njit(types.float64(_I64, _I64, _I64, _I64, _I64, _I64, _I64, _RULES), cache=True)
+def _outcome(
+    p_hard: int,
+    p_ace: int,
+    p_n: int,
+    d_hard: int,
+    d_ace: int,
+    d_n: int,
+    is_split: int,
+    rules: np.ndarray,
+) -> float:
+    """
+    Settle a finished hand against the dealer's final hand.
+
+    Returns:
+        float: The payout per unit bet.
+    """
+    p_score = _score(p_hard, p_ace)
+    d_score = _score(d_hard, d_ace)
+
+    p_natural = (
+        p_score == 21
+        and p_n == 2
+        and (not is_split or rules[NATURAL_BLACKJACK_SPLITS] != 0.0)
+    )
+    d_natural = d_score == 21 and d_n == 2
+
+    if p_natural and d_natural:
+        return 0.0
+    if p_natural:
+        return rules[BLACKJACK_ODDS]
+    if d_natural or p_score > 21:
+        return -1.0
+    if d_score > 21 or p_score > d_score:
+        return 1.0
+    if p_score < d_score:
+        return -1.0
+    return 0.0
+
+
+@njit(_STATE_SIG, cache=True)
+def _stand_ev(
+    deck: int,
+    p_hard: int,
+    p_ace: int,
+    p_n: int,
+    d_hard: int,
+    d_ace: int,
+    d_n: int,
+    is_split: int,
+    rules: np.ndarray,
+    memo: Dict,
+) -> float:
+    """
+    Compute the expected value of standing by recursing over every dealer draw.
+
+    Returns:
+        float: The expected value for standing.
+    """
+    key = _key(deck, p_hard, p_ace, p_n, d_hard, d_ace, d_n, is_split, STAND)
+
+    if key in memo:
+        return memo[key]
+
+    d_score = _score(d_hard, d_ace)
+    d_soft = d_ace and d_hard + 10 <= 21
+
+    if d_score > 17 or (
+        d_score == 17 and (not d_soft or rules[DEALER_HITS_ON_SOFT_17] == 0.0)
+    ):
+        ev = _outcome(p_hard, p_ace, p_n, d_hard, d_ace, d_n, is_split, rules)
+        memo[key] = ev
+        return ev
+
+    total_value = 0.0
+    total_cards = 0
+
+    for i in range(10):
+        count = _count(deck, i)
+
+        if count == 0:
+            continue
+
+        # A peeking dealer has already ruled out a blackjack under a ten or an ace
+        if rules[DEALER_PEAKS_FOR_21] != 0.0 and d_n == 1:
+            if (d_hard == 10 and i == 0) or (d_hard == 1 and i == 9):
+                continue
+
+        value = _card_value(i)
+        drawn = deck - _draw(i)
+        outcome = _stand_ev(
+            drawn,
+            p_hard,
+            p_ace,
+            p_n,
+            d_hard + value,
+            1 if d_ace or value == 1 else 0,
+            d_n + 1,
+            is_split,
+            rules,
+            memo,
+        )
+
+        total_value += outcome * count
+        total_cards += count
+
+    ev = total_value / total_cards if total_cards > 0 else 0.0
+    memo[key] = ev
+    return ev
+
+
+@njit(types.float64(_I64, _I64, _I64), cache=True)
+def _hit_bound(deck: int, p_hard: int, p_ace: int) -> float:
+    """
+    Get an upper bound on the expected value of hitting a hand of three or more cards.
+
+    Such a hand can no longer be a natural, so every draw that does not bust pays at most 1 and every draw that
+    busts pays exactly -1.
+
+    Returns:
+        float: The upper bound on the expected value for hitting.
+    """
+    total_value = 0.0
+    total_cards = 0
+
+    for i in range(10):
+        count = _count(deck, i)
+        value = _card_value(i)
+
+        if _score(p_hard + value, 1 if p_ace or value == 1 else 0) > 21:
+            total_value -= count
+        else:
+            total_value += count
+
+        total_cards += count
+
+    return total_value / total_cards if total_cards > 0 else 0.0
+
+
+@njit(_STATE_SIG, cache=True)
+def _hit_ev(
+    deck: int,
+    p_hard: int,
+    p_ace: int,
+    p_n: int,
+    d_hard: int,
+    d_ace: int,
+    d_n: int,
+    is_split: int,
+    rules: np.ndarray,
+    memo: Dict,
+) -> float:
+    """
+    Compute the expected value of hitting, playing each drawn card on as the better of standing and hitting.
+
+    Returns:
+        float: The expected value for hitting.
+    """
+    key = _key(deck, p_hard, p_ace, p_n, d_hard, d_ace, d_n, is_split, HIT)
+
+    if key in memo:
+        return memo[key]
+
+    total_value = 0.0
+    total_cards = 0
+
+    for i in range(10):
+        count = _count(deck, i)
+
+        if count == 0:
+            continue
+
+        value = _card_value(i)
+        hard = p_hard + value
+        ace = 1 if p_ace or value == 1 else 0
+        drawn = deck - _draw(i)
+
+        if _score(hard, ace) > 21:
+            total_value -= count
+        else:
+            best = _stand_ev(
+                drawn, hard, ace, p_n + 1, d_hard, d_ace, d_n, is_split, rules, memo
+            )
+
+            # Only the better of standing and hitting is kept, so skip a hit that cannot beat standing
+            if _hit_bound(drawn, hard, ace) > best:
+                best = max(
+                    best,
+                    _hit_ev(
+                        drawn,
+                        hard,
+                        ace,
+                        p_n + 1,
+                        d_hard,
+                        d_ace,
+                        d_n,
+                        is_split,
+                        rules,
+                        memo,
+                    ),
+                )
+
+            total_value += best * count
+
+        total_cards += count
+
+    ev = total_value / total_cards if total_cards > 0 else 0.0
+    memo[key] = ev
+    return ev
+
+
+@njit(_STATE_SIG, cache=True)
+def _double_ev(
+    deck: int,
+    p_hard: int,
+    p_ace: int,
+    p_n: int,
+    d_hard: int,
+    d_ace: int,
+    d_n: int,
+    is_split: int,
+    rules: np.ndarray,
+    memo: Dict,
+) -> float:
+    """
+    Compute the expected value of doubling, drawing exactly one card at twice the bet.
+
+    Returns:
+        float: The expected value for doubling.
+    """
+    key = _key(deck, p_hard, p_ace, p_n, d_hard, d_ace, d_n, is_split, DOUBLE)
+
+    if key in memo:
+        return memo[key]
+
+    total_value = 0.0
+    total_cards = 0
+
+    for i in range(10):
+        count = _count(deck, i)
+
+        if count == 0:
+            continue
+
+        value = _card_value(i)
+        hard = p_hard + value
+        ace = 1 if p_ace or value == 1 else 0
+        drawn = deck - _draw(i)
+
+        if _score(hard, ace) > 21:
+            total_value -= 2.0 * count
+        else:
+            stand = _stand_ev(
+                drawn, hard, ace, p_n + 1, d_hard, d_ace, d_n, is_split, rules, memo
+            )
+            total_value += 2.0 * stand * count
+
+        total_cards += count
+
+    ev = total_value / total_cards if total_cards > 0 else 0.0
+    memo[key] = ev
+    return ev
+
+
+@njit(types.float64(_I64, _I64, _I64, _I64, _I64, _RULES, _MEMO_TYPE), cache=True)
+def _split_ev(
+    deck: int,
+    split_value: int,
+    d_hard: int,
+    d_ace: int,
+    d_n: int,
+    rules: np.ndarray,
+    memo: Dict,
+) -> float:
+    """
+    Compute the expected value of splitting a pair, playing both hands as the first one plays.
+
+    Returns:
+        float: The expected value for splitting, over both hands.
+    """
+    ace_split = split_value == 1
+    p_ace = 1 if ace_split else 0
+    key = _key(deck, split_value, p_ace, 1, d_hard, d_ace, d_n, 1, SPLIT)
+
+    if key in memo:
+        return memo[key]
+
+    can_hit = not ace_split or rules[HIT_SPLIT_ACES] != 0.0
+    can_double = rules[DOUBLE_AFTER_SPLIT] != 0.0 and (
+        not ace_split
+        or (rules[HIT_SPLIT_ACES] != 0.0 and rules[DOUBLE_SPLIT_ACES] != 0.0)
+    )
+
+    total_value = 0.0
+    total_cards = 0
+
+    for i in range(10):
+        count = _count(deck, i)
+
+        if count == 0:
+            continue
+
+        value = _card_value(i)
+        hard = split_value + value
+        ace = 1 if p_ace or value == 1 else 0
+        drawn = deck - _draw(i)
+
+        best = _stand_ev(drawn, hard, ace, 2, d_hard, d_ace, d_n, 1, rules, memo)
+
+        if can_hit and _hit_bound(drawn, hard, ace) > best:
+            best = max(
+                best,
+                _hit_ev(drawn, hard, ace, 2, d_hard, d_ace, d_n, 1, rules, memo),
+            )
+        if can_double:
+            best = max(
+                best,
+                _double_ev(drawn, hard, ace, 2, d_hard, d_ace, d_n, 1, rules, memo),
+            )
+
+        total_value += 2.0 * best * count
+        total_cards += count
+
+    ev = total_value / total_cards if total_cards > 0 else 0.0
+    memo[key] = ev
+    return ev
+
+
+@njit(
+    types.void(_I64, _COUNTS, _I64, _I64, _I64, _COUNTS, _RULES, types.float64[::1]),
+    cache=True,
+)
+def _hand_evs(
+    deck: int,
+    hand_labels: np.ndarray,
+    d_hard: int,
+    d_ace: int,
+    d_n: int,
+    actions: np.ndarray,
+    rules: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """
+    Compute the expected values of the given actions for one player hand, sharing one memo between them.
+
+    Parameters:
+        deck (int): The packed remaining count of each card label 0-9.
+        hand_labels (np.ndarray): The int64 card labels of the player hand.
+        d_hard (int): The dealer hand total with every ace counted as 1.
+        d_ace (int): 1 if the dealer hand holds an ace, 0 otherwise.
+        d_n (int): The number of cards in the dealer hand.
+        actions (np.ndarray): The int64 action indices (STAND, HIT, DOUBLE, SPLIT) to compute.
+        rules (np.ndarray): The float64 rule values, indexed by the rule positions of this module.
+        out (np.ndarray): The float64 row receiving one expected value per action.
+    """
+    memo = Dict.empty(key_type=_KEY_TYPE, value_type=types.float64)
+    p_hard = 0
+    p_ace = 0
+
+    for label in hand_labels:
+        value = _card_value(label)
+        p_hard += value
+        p_ace = 1 if p_ace or value == 1 else 0
+
+    p_n = hand_labels.shape[0]
+    pair = p_n == 2 and _card_value(hand_labels[0]) == _card_value(hand_labels[1])
+
+    for a in range(actions.shape[0]):
+        action = actions[a]
+
+        if action == STAND:
+            ev = _stand_ev(deck, p_hard, p_ace, p_n, d_hard, d_ace, d_n, 0, rules, memo)
+        elif action == HIT:
+            ev = _hit_ev(deck, p_hard, p_ace, p_n, d_hard, d_ace, d_n, 0, rules, memo)
+        elif action == DOUBLE:
+            ev = _double_ev(
+                deck, p_hard, p_ace, p_n, d_hard, d_ace, d_n, 0, rules, memo
+            )
+        elif pair:
+            ev = _split_ev(
+                deck, _card_value(hand_labels[0]), d_hard, d_ace, d_n, rules, memo
+            )
+        else:
+            ev = -np.inf
+
+        out[a] = ev
+
+
+@njit(
+    types.float64[:, ::1](_COUNTS, _COUNTS, _COUNTS, _COUNTS, _COUNTS, _RULES),
+    cache=True,
+    parallel=True,
+    nogil=True,
+)
+def action_evs(
+    counts: np.ndarray,
+    hand_labels: np.ndarray,
+    hand_offsets: np.ndarray,
+    dealer_labels: np.ndarray,
+    actions: np.ndarray,
+    rules: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute the expected values of the given actions for several player hands against one dealer hand.
+
+    Player hands are packed back to back in hand_labels, with hand i spanning hand_offsets[i] to
+    hand_offsets[i + 1]. The counts are packed into one integer that the recursion draws from by subtraction
+    and that doubles as the deck half of the memo key. Hands are evaluated in parallel, each with its own memo.
+    Within a hand the requested actions are computed in one pass over that memo, so the dealer subtrees solved
+    for standing are reused by the hit, double, and split recursions, while different hands share almost no
+    states. The GIL is released for the whole call. A split of a hand that is not a pair is -inf.
+
+    Parameters:
+        counts (np.ndarray): The int64 remaining count of each card label 0-9 (shape: [10]).
+        hand_labels (np.ndarray): The int64 card labels of every player hand, concatenated.
+        hand_offsets (np.ndarray): The int64 start offset of each hand, followed by the total length.
+        dealer_labels (np.ndarray): The int64 card labels of the dealer hand.
+        actions (np.ndarray): The int64 action indices (STAND, HIT, DOUBLE, SPLIT) to compute.
+        rules (np.ndarray): The float64 rule values, indexed by the rule positions of this module.
+
+    Returns:
+        np.ndarray: An array of shape (hands, actions) holding the expected values.
+
+    Raises:
+        ValueError: If a card count does not fit the packed deck (more than 15 decks).
+    """
+    for i in range(9):
+        if counts[i] < 0 or counts[i] > MAX_LABEL_COUNT:
+            raise ValueError("Card count out of range for the packed deck")
+
+    if counts[9] < 0 or counts[9] > MAX_TEN_COUNT:
+        raise ValueError("Card count out of range for the packed deck")
+
+    deck = _pack_deck(counts)
+    d_hard = 0
+    d_ace = 0
+
+    for label in dealer_labels:
+        value = _card_value(label)
+        d_hard += value
+        d_ace = 1 if d_ace or value == 1 else 0
+
+    d_n = dealer_labels.shape[0]
+    n_hands = hand_offsets.shape[0] - 1
+    evs = np.empty((n_hands, actions.shape[0]), dtype=np.float64)
+
+    for h in prange(n_hands):
+        _hand_evs(
+            deck,
+            hand_labels[hand_offsets[h] : hand_offsets[h + 1]],
+            d_hard,
+            d_ace,
+            d_n,
+            actions,
+            rules,
+            evs[h],
+        )
+
+    return evs
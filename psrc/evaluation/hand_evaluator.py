@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from psrc.core.interfaces.i_card_deck import ICardDeck
 from psrc.core.interfaces.i_ev_calculator import IExpectedValueCalculator
@@ -26,15 +26,47 @@ class HandEvaluator(IHandEvaluator):
         self.deck = deck
         self.ev_calc = ev_calculator
 
+        # Results of the last evaluation, keyed by deck version and hand contents
+        self._last_key: Optional[Tuple] = None
+        self._last_results: Dict[int, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _best_action(evs: Dict[str, float]) -> str:
+        """
+        Select the action with the highest expected value.
+
+        The five actions are compared with explicit scalar comparisons instead of iterating the dict, and ties
+        resolve to the earlier action in stand, hit, double, split, surrender order.
+
+        Parameters:
+            evs (Dict[str, float]): A mapping of action names to their expected values.
+
+        Returns:
+            str: The name of the best action.
+        """
+        best_action, best_ev = "stand", evs["stand"]
+
+        if evs["hit"] > best_ev:
+            best_action, best_ev = "hit", evs["hit"]
+        if evs["double"] > best_ev:
+            best_action, best_ev = "double", evs["double"]
+        if evs["split"] > best_ev:
+            best_action, best_ev = "split", evs["split"]
+        if evs["surrender"] > best_ev:
+            best_action = "surrender"
+
+        return best_action
+
     def evaluate_hands(
         self, hands: Dict[str, Dict[str, Any]]
     ) -> Dict[int, Dict[str, Any]]:
         """
         Evaluate each player's hand and select the optimal action.
 
-        This implementation skips evaluation if no dealer hand is present, for each non-dealer hand computes
-        EVs for stand, hit, double, split, and surrender by calling the EV calculator, and records the best
-        action.
+        This implementation skips evaluation if no dealer hand is present, returns the previous results when the
+        deck version and every hand's cards are unchanged, and otherwise computes the stand, hit, double, split,
+        and surrender EVs of every non-dealer hand with a single batched EV calculator call and records the best
+        action for each.
 
         Parameters:
             hands (Dict[str, Dict[str, Any]]): A mapping of hand IDs to their hand information.
@@ -58,32 +90,42 @@ class HandEvaluator(IHandEvaluator):
         if not dealer_cards:
             return {}
 
-        # Compute EVs for each player hand, skipping over the dealer
-        for hand_id, info in hands.items():
-            if hand_id == 0:
-                continue
-
-            player_cards = info.get("cards", [])
-            evs: Dict[str, float] = {}
-
-            evs["stand"] = self.ev_calc.calculate_stand_ev(
-                self.deck.cards, player_cards, dealer_cards
-            )
-            evs["hit"] = self.ev_calc.calculate_hit_ev(
-                self.deck.cards, player_cards, dealer_cards
-            )
-            evs["double"] = self.ev_calc.calculate_double_ev(
-                self.deck.cards, player_cards, dealer_cards
-            )
-            evs["split"] = self.ev_calc.calculate_split_ev(
-                self.deck.cards, player_cards, dealer_cards
-            )
-            evs["surrender"] = self.ev_calc.calculate_surrender_ev(
-                self.deck.cards, player_cards, dealer_cards
-            )
-
-            # Determine best available action based on highest EV
-            best_action = max(evs, key=evs.get)
+        # Hands sitting still on an unchanged deck evaluate to exactly the previous results
+        key = (
+            self.deck.version,
+            tuple(
+                (hand_id, tuple(info.get("cards", [])))
+                for hand_id, info in hands.items()
+            ),
+        )
+
+        if key == self._last_key:
+            return self._last_results
+
+        # Evaluate every player hand in one batched call, skipping over the dealer
+        player_ids = [hand_id for hand_id in hands if hand_id != 0]
+        player_hands = [hands[hand_id].get("cards", []) for hand_id in player_ids]
+
+        if not player_ids:
+            return {}
+
+        batch_evs = self.ev_calc.calculate_all_evs(
+            self.deck.counts, player_hands, dealer_cards
+        )
+
+        for hand_id, evs in zip(player_ids, batch_evs):
+            best_action = self._best_action(evs)
             results[hand_id] = {"evs": evs, "best_action": best_action}
 
+        self._last_key = key
+        self._last_results = results
+
         return results
+
+    def release(self) -> None:
+        """
+        Release evaluator resources.
+
+        This implementation holds no resources of its own; the EV calculator is released by its owner.
+        """
+        pass
@@ -0,0 +1,236 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from psrc.core.interfaces.i_ev_calculator import IExpectedValueCalculator
+from psrc.evaluation.ev_kernels import DOUBLE, HIT, SPLIT, STAND, action_evs
+
+
+class NumbaEVCalculator(IExpectedValueCalculator):
+    """
+    NumbaEVCalculator is an implementation of the IExpectedValueCalculator interface.
+
+    This implementation computes expected values in-process with the Numba-compiled recursion in ev_kernels,
+    following the same rules as the Java EVCalculator, so no JVM has to be started and no values cross a JNI
+    boundary. The deck count vector is copied for the kernel, which releases the GIL while it runs, and the
+    hands are packed into int64 arrays.
+
+    Attributes:
+        BATCH_ACTIONS (Tuple[Tuple[str, int], ...]): The action names and matching kernel action indices, in
+        the column order of a batch call.
+    """
+
+    BATCH_ACTIONS = (
+        ("stand", STAND),
+        ("hit", HIT),
+        ("double", DOUBLE),
+        ("split", SPLIT),
+    )
+
+    def __init__(
+        self,
+        blackjack_odds: float = 1.5,
+        dealer_hits_on_soft_17: bool = True,
+        dealer_peaks_for_21: bool = True,
+        natural_blackjack_splits: bool = False,
+        double_after_split: bool = True,
+        hit_split_aces: bool = False,
+        double_split_aces: bool = False,
+    ) -> None:
+        """
+        Initialize NumbaEVCalculator with the table rules.
+
+        Parameters:
+            blackjack_odds (float): The payout multiplier for a natural blackjack.
+            dealer_hits_on_soft_17 (bool): Whether the dealer draws on a soft 17.
+            dealer_peaks_for_21 (bool): Whether the dealer checks for blackjack under an ace or ten-value card.
+            natural_blackjack_splits (bool): Whether a split hand that is a natural counts as a blackjack.
+            double_after_split (bool): Whether hands may be doubled after splitting.
+            hit_split_aces (bool): Whether split aces may be hit.
+            double_split_aces (bool): Whether split aces may be doubled.
+        """
+        # Rule values in the order of the rule positions in ev_kernels
+        self._rules = np.array(
+            [
+                blackjack_odds,
+                dealer_hits_on_soft_17,
+                dealer_peaks_for_21,
+                natural_blackjack_splits,
+                double_after_split,
+                hit_split_aces,
+                double_split_aces,
+            ],
+            dtype=np.float64,
+        )
+        self._all_actions = np.array(
+            [index for _, index in self.BATCH_ACTIONS], dtype=np.int64
+        )
+
+    def _calculate(
+        self,
+        actions: np.ndarray,
+        deck: Sequence[int],
+        player_hands: Sequence[List[int]],
+        dealer_hand: List[int],
+    ) -> np.ndarray:
+        """
+        Pack the deck and hands into arrays and run the expected value kernel.
+
+        Parameters:
+            actions (np.ndarray): The int64 kernel action indices to compute.
+            deck (Sequence[int]): The remaining count of each card label 0-9.
+            player_hands (Sequence[List[int]]): A sequence of player hands, each a list of card labels.
+            dealer_hand (List[int]): A list of card labels in the dealer's hand.
+
+        Returns:
+            np.ndarray: An array of shape (hands, actions) holding the expected values.
+        """
+        # Copy the counts, since the kernel runs without the GIL while the deck may change on another thread
+        counts = np.array(deck, dtype=np.int64)
+        offsets = np.zeros(len(player_hands) + 1, dtype=np.int64)
+        np.cumsum([len(hand) for hand in player_hands], out=offsets[1:])
+        labels = np.array(
+            [card for hand in player_hands for card in hand], dtype=np.int64
+        )
+
+        return action_evs(
+            counts,
+            labels,
+            offsets,
+            np.array(dealer_hand, dtype=np.int64),
+            actions,
+            self._rules,
+        )
+
+    def calculate_stand_ev(
+        self, deck: Sequence[int], player_hand: List[int], dealer_hand: List[int]
+    ) -> float:
+        """
+        Calculate the expected value when the player stands.
+
+        This implementation runs the compiled stand recursion over every dealer draw.
+
+        Parameters:
+            deck (Sequence[int]): The remaining count of each card label 0-9.
+            player_hand (List[int]): A list of card labels in the player's hand.
+            dealer_hand (List[int]): A list of card labels in the dealer's hand.
+
+        Returns:
+            float: The expected value for the stand decision.
+        """
+        actions = self._all_actions[STAND : STAND + 1]
+        return float(self._calculate(actions, deck, [player_hand], dealer_hand)[0, 0])
+
+    def calculate_hit_ev(
+        self, deck: Sequence[int], player_hand: List[int], dealer_hand: List[int]
+    ) -> float:
+        """
+        Calculate the expected value when the player hits.
+
+        This implementation runs the compiled hit recursion, playing each drawn card on optimally.
+
+        Parameters:
+            deck (Sequence[int]): The remaining count of each card label 0-9.
+            player_hand (List[int]): A list of card labels in the player's hand.
+            dealer_hand (List[int]): A list of card labels in the dealer's hand.
+
+        Returns:
+            float: The expected value for the hit decision.
+        """
+        actions = self._all_actions[HIT : HIT + 1]
+        return float(self._calculate(actions, deck, [player_hand], dealer_hand)[0, 0])
+
+    def calculate_double_ev(
+        self, deck: Sequence[int], player_hand: List[int], dealer_hand: List[int]
+    ) -> float:
+        """
+        Calculate the expected value when the player doubles.
+
+        This implementation runs the compiled double recursion, drawing exactly one card at twice the bet.
+
+        Parameters:
+            deck (Sequence[int]): The remaining count of each card label 0-9.
+            player_hand (List[int]): A list of card labels in the player's hand.
+            dealer_hand (List[int]): A list of card labels in the dealer's hand.
+
+        Returns:
+            float: The expected value for the double decision.
+        """
+        actions = self._all_actions[DOUBLE : DOUBLE + 1]
+        return float(self._calculate(actions, deck, [player_hand], dealer_hand)[0, 0])
+
+    def calculate_split_ev(
+        self, deck: Sequence[int], player_hand: List[int], dealer_hand: List[int]
+    ) -> float:
+        """
+        Calculate the expected value when the player splits.
+
+        This implementation runs the compiled split recursion, returning -inf when the hand is not a pair.
+
+        Parameters:
+            deck (Sequence[int]): The remaining count of each card label 0-9.
+            player_hand (List[int]): A list of card labels in the player's hand.
+            dealer_hand (List[int]): A list of card labels in the dealer's hand.
+
+        Returns:
+            float: The expected value for the split decision.
+        """
+        actions = self._all_actions[SPLIT : SPLIT + 1]
+        return float(self._calculate(actions, deck, [player_hand], dealer_hand)[0, 0])
+
+    def calculate_all_evs(
+        self,
+        deck: Sequence[int],
+        player_hands: List[List[int]],
+        dealer_hand: List[int],
+    ) -> List[Dict[str, float]]:
+        """
+        Calculate the expected values of every action for several player hands against one dealer hand.
+
+        This implementation computes the stand, hit, double, and split values of every hand in a single kernel
+        call, evaluating the hands in parallel. Surrender is always -0.5.
+
+        Parameters:
+            deck (Sequence[int]): The remaining count of each card label 0-9.
+            player_hands (List[List[int]]): A list of player hands, each a list of card labels.
+            dealer_hand (List[int]): A list of card labels in the dealer's hand.
+
+        Returns:
+            List[Dict[str, float]]: One dict per player hand, in input order, mapping "stand", "hit", "double",
+            "split", and "surrender" to their expected values.
+        """
+        rows = self._calculate(self._all_actions, deck, player_hands, dealer_hand)
+        results = []
+
+        for row in rows.tolist():
+            evs = {action: value for (action, _), value in zip(self.BATCH_ACTIONS, row)}
+            evs["surrender"] = -0.5
+            results.append(evs)
+
+        return results
+
+    def calculate_surrender_ev(
+        self, deck: Sequence[int], player_hand: List[int], dealer_hand: List[int]
+    ) -> float:
+        """
+        Calculate the expected value when the player surrenders.
+
+        This implementation returns a fixed value of -0.5.
+
+        Parameters:
+            deck (Sequence[int]): The remaining count of each card label 0-9.
+            player_hand (List[int]): A list of card labels in the player's hand.
+            dealer_hand (List[int]): A list of card labels in the dealer's hand.
+
+        Returns:
+            float: The expected value for the surrender decision.
+        """
+        return -0.5
+
+    def release(self) -> None:
+        """
+        Release calculator resources.
+
+        This implementation holds no external resources, so there is nothing to release.
+        """
+        pass
@@ -10,7 +10,8 @@ class OCVVideoStream(IFrameReader):
     OCVVideoStream is an implementation of the IFrameReader interface.
 
     This implementation uses OpenCV’s VideoCapture to open a video source, read frames on demand, report the
-    source’s FPS, and release resources.
+    source’s FPS, and release resources. Live camera sources are opened with a single-frame capture buffer so
+    each read returns the newest frame.
     """
 
     def __init__(
@@ -38,6 +39,10 @@ class OCVVideoStream(IFrameReader):
         self.stream.set(cv2.CAP_PROP_FRAME_WIDTH, width)
         self.stream.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
 
+        # Keep at most one frame queued inside live capture backends so reads never return stale frames
+        if isinstance(video_source, int):
+            self.stream.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
     def read_frame(self) -> Any:
         """
         Read the next frame from the video source.